@@ -0,0 +1,22 @@
+"""Console entry point for MetaClaude.
+
+Kept free of heavy imports so ``metaclaude --version`` answers without loading
+typer, rich or the orchestrator.
+"""
+
+import sys
+
+
+def run() -> None:
+    """Run the MetaClaude CLI."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+        from . import __version__
+        print(f"MetaClaude v{__version__}")
+        sys.exit(0)
+
+    from .cli import app
+    app()
+
+
+if __name__ == "__main__":
+    run()
@@ -6,9 +6,13 @@ for projects. Instead of forcing JSON responses, it lets Claude Code create
 agent files naturally and then parses those files.
 """
 
+import asyncio
+import io
 import os
-import tempfile
-import time
+import posixpath
+import re
+import tarfile
+import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
@@ -16,55 +20,38 @@ from datetime import datetime
 
 from ..utils.logging import get_logger
 from ..utils.errors import MetaClaudeAgentError
-from .parser import AgentConfig
+from .parser import AgentConfigFast, SafeLoader, split_front_matter
 
 logger = get_logger(__name__)
 
+AGENTS_DIR = "/workspace/.claude/agents"
 
-@dataclass
-class ClaudeCreatedAgent:
-    """An agent created by Claude Code naturally."""
-    name: str
-    description: str
-    system_prompt: str
-    file_path: str
-    tools: List[str] = None
-    reasoning: str = ""
+# One "key: value" line of the front-matter schema the creation prompt asks for
+_SIMPLE_FRONTMATTER_LINE_RE = re.compile(
+    r"(name|description|tools|parallelism|patterns):[ \t]*(\S.*?)[ \t]*"
+)
+_SIMPLE_FRONTMATTER_MAX_LINES = 8
+_LEADING_SPACE_RE = re.compile(r"\s*")
+# Characters with special meaning in YAML that the fast path does not handle
+_YAML_SPECIAL_CHARS = frozenset("#\\{}&*!|>%@`")
+# Indicators that change the meaning of a plain scalar when they start it
+_YAML_LEADING_INDICATORS = frozenset("-?:,[]'\"")
+_DECIMAL_RE = re.compile(r"0|[1-9][0-9]*")
+# Resolves plain scalars the way the YAML loader would (null, bools, numbers, dates)
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
 
+# Tools given to Claude-created agents whose files do not list usable tools
+_DEFAULT_AGENT_TOOLS = ("Read", "Write", "Edit", "TodoWrite")
 
-class NaturalClaudeAgentCreator:
-    """
-    Creates agents by letting Claude Code work naturally to create agent files.
-    
-    This approach:
-    1. Gives Claude Code a natural prompt to analyze the project
-    2. Asks Claude to create individual .md files for specialized agents
-    3. Parses the created files to extract agent information
-    4. Converts to internal agent format
-    """
-    
-    def __init__(self, docker_manager=None):
-        """Initialize natural Claude Code agent creator.
-        
-        Args:
-            docker_manager: Docker manager for running Claude Code
-        """
-        self.docker_manager = docker_manager
-        
-    def create_agent_creation_prompt(self, idea: str) -> str:
-        """Create a natural prompt for Claude Code to create agents.
-        
-        Args:
-            idea: Project idea description
-            
-        Returns:
-            Natural language prompt for Claude Code
-        """
-        return f"""# Agent Creation Task
+# Static parts of the agent creation prompt, split around the two idea slots
+_PROMPT_PREFIX = """# Agent Creation Task
 
 I need you to analyze this project idea and create specialized sub-agents that would work together optimally to complete this project:
 
-**Project Idea:** {idea}
+**Project Idea:** """
+
+_PROMPT_MIDDLE = """
 
 ## Your Task
 
@@ -117,11 +104,149 @@ Explain why this specific agent is needed for this project.
 - DevOpsEngineer (for deployment/infrastructure)
 - SecurityAuditor (for security review)
 
-Create the agents that make the most sense for: **{idea}**
+Create the agents that make the most sense for: **"""
+
+_PROMPT_SUFFIX = """**
 
 Start by analyzing the project, then create the appropriate agent files in `.claude/agents/`.
 """
 
+
+def _unquote_scalar(value: str) -> Optional[str]:
+    """Strip matching quotes from a plain scalar, or None if it needs real YAML."""
+    if value[:1] in ("'", '"'):
+        if len(value) < 2 or value[-1] != value[0] or value[0] in value[1:-1]:
+            return None
+        return value[1:-1]
+    if value[-1:] in ("'", '"'):
+        return None
+    if (
+        not value
+        or value[0] in _YAML_LEADING_INDICATORS
+        or ": " in value
+        or value.endswith(":")
+        or _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) != _YAML_STR_TAG
+    ):
+        # Mappings, keywords such as null/yes/true and numbers need real YAML
+        return None
+    return value
+
+
+def _parse_simple_front_matter(front_matter: str) -> Optional[Dict[str, Any]]:
+    """Parse the flat front-matter schema used by Claude-created agent files.
+    
+    Only handles up to a few ``key: value`` lines for the known keys, with
+    plain or quoted string scalars and single-line ``[a, b]`` lists. Anything
+    YAML would read differently (nested mappings, null/yes/true, numbers)
+    is left to the YAML parser.
+    
+    Args:
+        front_matter: Front-matter text without the ``---`` delimiters
+        
+    Returns:
+        Parsed metadata, or None if the text should go through the YAML parser
+    """
+    lines = front_matter.splitlines()
+    if len(lines) > _SIMPLE_FRONTMATTER_MAX_LINES:
+        return None
+    
+    metadata: Dict[str, Any] = {}
+    for line in lines:
+        match = _SIMPLE_FRONTMATTER_LINE_RE.fullmatch(line)
+        if match is None or not _YAML_SPECIAL_CHARS.isdisjoint(match.group(2)):
+            return None
+        
+        key, value = match.groups()
+        if key == "parallelism":
+            if not _DECIMAL_RE.fullmatch(value):
+                return None
+            metadata[key] = int(value)
+        elif key in ("tools", "patterns"):
+            if not (value.startswith("[") and value.endswith("]")):
+                return None
+            items = []
+            for item in value[1:-1].split(","):
+                item = _unquote_scalar(item.strip())
+                if not item or "[" in item or "]" in item:
+                    return None
+                items.append(item)
+            metadata[key] = items
+        else:
+            value = _unquote_scalar(value)
+            if value is None:
+                return None
+            metadata[key] = value
+    
+    return metadata
+
+
+def _normalize_tools(tools: Any) -> List[str]:
+    """Coerce a front-matter ``tools`` value to a list of tool names.
+    
+    Accepts a list of strings or a comma-separated string such as
+    ``Read, Write``; anything else falls back to the default tools.
+    """
+    if isinstance(tools, str):
+        tools = tools.split(",")
+    if isinstance(tools, list) and all(isinstance(tool, str) for tool in tools):
+        tools = [tool.strip() for tool in tools if tool.strip()]
+        if tools:
+            return tools
+    elif tools is not None:
+        logger.warning(f"Ignoring invalid agent tools: {tools!r}")
+    return list(_DEFAULT_AGENT_TOOLS)
+
+
+def _normalize_text(value: Any, default: str) -> str:
+    """Coerce a front-matter scalar to a string, using default if it is missing."""
+    if isinstance(value, str):
+        return value.strip() or default
+    if value is None or isinstance(value, (list, dict)):
+        return default
+    return str(value)
+
+
+@dataclass
+class ClaudeCreatedAgent:
+    """An agent created by Claude Code naturally."""
+    name: str
+    description: str
+    system_prompt: str
+    file_path: str
+    tools: List[str] = None
+    reasoning: str = ""
+
+
+class NaturalClaudeAgentCreator:
+    """
+    Creates agents by letting Claude Code work naturally to create agent files.
+    
+    This approach:
+    1. Gives Claude Code a natural prompt to analyze the project
+    2. Asks Claude to create individual .md files for specialized agents
+    3. Parses the created files to extract agent information
+    4. Converts to internal agent format
+    """
+    
+    def __init__(self, docker_manager=None):
+        """Initialize natural Claude Code agent creator.
+        
+        Args:
+            docker_manager: Docker manager for running Claude Code
+        """
+        self.docker_manager = docker_manager
+        
+    def create_agent_creation_prompt(self, idea: str) -> str:
+        """Create a natural prompt for Claude Code to create agents.
+        
+        Args:
+            idea: Project idea description
+            
+        Returns:
+            Natural language prompt for Claude Code
+        """
+        return f"{_PROMPT_PREFIX}{idea}{_PROMPT_MIDDLE}{idea}{_PROMPT_SUFFIX}"
+
     async def create_agents_with_claude(
         self, 
         idea: str, 
@@ -148,83 +273,111 @@ Start by analyzing the project, then create the appropriate agent files in `.cla
             # Create the natural prompt
             prompt = self.create_agent_creation_prompt(idea)
             
-            # Create a temporary file with the prompt
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-                f.write(prompt)
-                prompt_file = f.name
-            
-            try:
-                # Copy prompt file to container
-                container = self.docker_manager.client.containers.get(container_id)
-                self.docker_manager.copy_to_container(
-                    container, 
-                    Path(prompt_file), 
-                    "/workspace"
-                )
-                
-                prompt_container_path = f"/workspace/{Path(prompt_file).name}"
-                
-                # Create the .claude/agents directory in container
-                logger.info("Creating .claude/agents directory in container...")
-                self.docker_manager.execute_command(
-                    container,
-                    "mkdir -p /workspace/.claude/agents",
-                    workdir="/workspace"
-                )
-                
-                # Execute Claude Code to analyze and create agents
-                claude_command = f"claude-code --dangerously-skip-permissions {prompt_container_path}"
-                
-                logger.info("Executing Claude Code for natural agent creation...")
-                exit_code, output = self.docker_manager.execute_command(
-                    container, 
-                    claude_command,
-                    workdir="/workspace"
-                )
-                
-                if exit_code != 0:
-                    logger.warning(f"Claude Code execution had issues (exit code {exit_code}): {output}")
-                    # Don't fail immediately, Claude might have still created files
-                
-                # Wait a moment for file system to settle
-                time.sleep(2)
-                
-                # Check what files were created in .claude/agents
-                logger.info("Checking for created agent files...")
-                exit_code, ls_output = self.docker_manager.execute_command(
-                    container,
-                    "ls -la /workspace/.claude/agents/",
-                    workdir="/workspace"
-                )
-                
-                if exit_code == 0:
-                    logger.info(f"Files in .claude/agents: {ls_output}")
-                else:
-                    logger.warning("Could not list .claude/agents directory")
-                
-                # Parse created agent files
+            # Stream the prompt straight into the container, no host temp file
+            container = self.docker_manager.client.containers.get(container_id)
+            prompt_container_path = self.docker_manager.write_file_to_container(
+                container,
+                prompt.encode("utf-8"),
+                "/workspace",
+                "agent_creation_prompt.md"
+            )
+            
+            # Create the agents directory, run Claude Code and tar the results back
+            # in a single exec. Claude's own output goes to stderr so stdout only
+            # carries the archive.
+            script = (
+                f"mkdir -p {AGENTS_DIR} && "
+                f"claude-code --dangerously-skip-permissions {prompt_container_path} 1>&2; "
+                "status=$?; "
+                f"tar -cf - -C {AGENTS_DIR} .; "
+                "exit $status"
+            )
+            
+            logger.info("Executing Claude Code for natural agent creation...")
+            exit_code, archive, output = self.docker_manager.execute_shell(
+                container,
+                script,
+                workdir="/workspace"
+            )
+            
+            if exit_code != 0:
+                logger.warning(f"Claude Code execution had issues (exit code {exit_code}): {output}")
+                # Don't fail immediately, Claude might have still created files
+            
+            # Parse created agent files from the returned archive
+            created_agents = self._parse_agent_archive(archive, AGENTS_DIR)
+            
+            if not created_agents and await self._wait_for_agent_files(container):
+                # Files showed up after the archive was taken, read them directly
                 created_agents = await self._parse_created_agent_files(container)
-                
-                if not created_agents:
-                    logger.warning("No agents were created by Claude Code")
-                    return self._create_fallback_agent(idea)
-                
-                logger.info(f"Claude naturally created {len(created_agents)} agents: "
-                          f"{[a.name for a in created_agents]}")
-                
-                return created_agents
-                
-            finally:
-                # Cleanup temp file
-                Path(prompt_file).unlink(missing_ok=True)
-                
+            
+            if not created_agents:
+                logger.warning("No agents were created by Claude Code")
+                return self._create_fallback_agent(idea)
+            
+            logger.info(f"Claude naturally created {len(created_agents)} agents: "
+                      f"{[a.name for a in created_agents]}")
+            
+            return created_agents
+            
         except Exception as e:
             logger.error(f"Natural Claude agent creation failed: {e}")
             return self._create_fallback_agent(idea)
     
+    async def _wait_for_agent_files(
+        self, container, timeout: float = 0.5, interval: float = 0.05
+    ) -> bool:
+        """Poll briefly until at least one agent file exists in the container.
+        
+        Args:
+            container: Docker container
+            timeout: Maximum time to wait in seconds
+            interval: Delay between checks in seconds
+            
+        Returns:
+            True if an agent file was found, False otherwise
+        """
+        for _ in range(max(1, int(timeout / interval))):
+            # The Docker exec blocks, so run it off the event loop
+            exit_code, output = await asyncio.to_thread(
+                self.docker_manager.execute_command,
+                container,
+                f"find {AGENTS_DIR} -maxdepth 1 -name '*.md' -print -quit",
+                workdir="/workspace",
+            )
+            if exit_code == 0 and output.strip():
+                return True
+            await asyncio.sleep(interval)
+        
+        logger.warning("No .md files found in .claude/agents directory")
+        return False
+    
     async def _parse_created_agent_files(self, container) -> List[ClaudeCreatedAgent]:
         """Parse agent files created by Claude Code.
         
+        Fetches the whole agents directory with a single archive request and
+        falls back to reading files one by one if that fails.
+        
+        Args:
+            container: Docker container
+            
+        Returns:
+            List of parsed agents
+        """
+        try:
+            bits, _ = container.get_archive(AGENTS_DIR)
+            archive = io.BytesIO()
+            for chunk in bits:
+                archive.write(chunk)
+        except Exception as e:
+            logger.warning(f"Could not fetch agents archive, reading files individually: {e}")
+            return await self._parse_agent_files_individually(container)
+        
+        return self._parse_agent_archive(archive.getvalue(), posixpath.dirname(AGENTS_DIR))
+    
+    async def _parse_agent_files_individually(self, container) -> List[ClaudeCreatedAgent]:
+        """Parse agent files created by Claude Code with one exec per file.
+        
         Args:
             container: Docker container
             
@@ -237,7 +390,7 @@ Start by analyzing the project, then create the appropriate agent files in `.cla
             # List all .md files in the agents directory
             exit_code, output = self.docker_manager.execute_command(
                 container,
-                "find /workspace/.claude/agents -name '*.md' -type f",
+                f"find {AGENTS_DIR} -name '*.md' -type f",
                 workdir="/workspace"
             )
             
@@ -248,30 +401,86 @@ Start by analyzing the project, then create the appropriate agent files in `.cla
             file_paths = [path.strip() for path in output.strip().split('\n') if path.strip()]
             logger.info(f"Found {len(file_paths)} agent files: {file_paths}")
             
-            for file_path in file_paths:
-                try:
-                    # Read the file content
-                    exit_code, content = self.docker_manager.execute_command(
-                        container,
-                        f"cat {file_path}",
-                        workdir="/workspace"
-                    )
-                    
-                    if exit_code == 0 and content.strip():
-                        agent = self._parse_agent_file_content(content, file_path)
-                        if agent:
-                            agents.append(agent)
-                            logger.info(f"Parsed agent: {agent.name}")
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse agent file {file_path}: {e}")
-                    continue
+            # Each read is a blocking docker exec, so run them concurrently
+            results = await asyncio.gather(*(
+                asyncio.to_thread(self._read_and_parse_agent_file, container, file_path)
+                for file_path in file_paths
+            ))
+            agents = [agent for agent in results if agent]
             
         except Exception as e:
             logger.error(f"Failed to parse created agent files: {e}")
         
         return agents
     
+    def _read_and_parse_agent_file(
+        self, container, file_path: str
+    ) -> Optional[ClaudeCreatedAgent]:
+        """Read a single agent file from the container and parse it.
+        
+        Args:
+            container: Docker container
+            file_path: Path to the agent file inside the container
+            
+        Returns:
+            Parsed agent or None if reading or parsing fails
+        """
+        try:
+            exit_code, content = self.docker_manager.execute_command(
+                container,
+                f"cat {file_path}",
+                workdir="/workspace"
+            )
+            
+            if exit_code == 0 and content.strip():
+                agent = self._parse_agent_file_content(content, file_path)
+                if agent:
+                    logger.info(f"Parsed agent: {agent.name}")
+                return agent
+            
+        except Exception as e:
+            logger.warning(f"Failed to parse agent file {file_path}: {e}")
+        
+        return None
+    
+    def _parse_agent_archive(self, archive: bytes, base_dir: str) -> List[ClaudeCreatedAgent]:
+        """Parse agent files from a tar archive of the agents directory.
+        
+        Args:
+            archive: Raw tar archive bytes
+            base_dir: Container directory the archive members are relative to
+            
+        Returns:
+            List of parsed agents
+        """
+        agents = []
+        
+        if not archive:
+            return agents
+        
+        try:
+            with tarfile.open(fileobj=io.BytesIO(archive), mode="r:") as tar:
+                for member in tar:
+                    if not member.isfile() or not member.name.endswith(".md"):
+                        continue
+                    
+                    file_path = posixpath.normpath(posixpath.join(base_dir, member.name))
+                    try:
+                        content = tar.extractfile(member).read().decode("utf-8")
+                        if content.strip():
+                            agent = self._parse_agent_file_content(content, file_path)
+                            if agent:
+                                agents.append(agent)
+                                logger.info(f"Parsed agent: {agent.name}")
+                    except Exception as e:
+                        logger.warning(f"Failed to parse agent file {file_path}: {e}")
+                        continue
+            
+        except tarfile.TarError as e:
+            logger.warning(f"Could not read agents archive: {e}")
+        
+        return agents
+    
     def _parse_agent_file_content(self, content: str, file_path: str) -> Optional[ClaudeCreatedAgent]:
         """Parse individual agent file content.
         
@@ -283,44 +492,29 @@ Start by analyzing the project, then create the appropriate agent files in `.cla
             Parsed agent or None if parsing fails
         """
         try:
-            # Extract YAML front matter and content
-            lines = content.strip().split('\n')
+            # Extract YAML front matter and content, skipping leading blank
+            # space by offset rather than copying the whole file
+            start = _LEADING_SPACE_RE.match(content).end()
             
-            if not lines or lines[0] != '---':
+            if not content.startswith('---', start):
                 logger.warning(f"Agent file {file_path} missing YAML front matter")
                 return None
             
-            # Find end of YAML front matter
-            yaml_end = -1
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    yaml_end = i
-                    break
-            
-            if yaml_end == -1:
+            parts = split_front_matter(content, start)
+            if parts is None:
                 logger.warning(f"Agent file {file_path} has malformed YAML front matter")
                 return None
             
-            # Parse YAML front matter (simple parsing)
-            yaml_lines = lines[1:yaml_end]
-            metadata = {}
+            front_matter, system_prompt = parts
             
-            for line in yaml_lines:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Handle arrays
-                    if value.startswith('[') and value.endswith(']'):
-                        value = [item.strip().strip('"').strip("'") for item in value[1:-1].split(',')]
-                    else:
-                        value = value.strip('"').strip("'")
-                    
-                    metadata[key] = value
-            
-            # Get system prompt from content after YAML
-            system_prompt = '\n'.join(lines[yaml_end + 1:]).strip()
+            # Parse YAML front matter, skipping the YAML parser for the common
+            # flat schema Claude is asked to produce
+            metadata = _parse_simple_front_matter(front_matter)
+            if metadata is None:
+                metadata = yaml.load(front_matter, Loader=SafeLoader) or {}
+            if not isinstance(metadata, dict):
+                logger.warning(f"Agent file {file_path} front matter is not a mapping")
+                return None
             
             # Create agent
             agent = ClaudeCreatedAgent(
@@ -328,7 +522,7 @@ Start by analyzing the project, then create the appropriate agent files in `.cla
                 description=metadata.get('description', 'Claude-created agent'),
                 system_prompt=system_prompt,
                 file_path=file_path,
-                tools=metadata.get('tools', ['Read', 'Write', 'Edit', 'TodoWrite']),
+                tools=metadata.get('tools', list(_DEFAULT_AGENT_TOOLS)),
                 reasoning=f"Created by Claude Code for specific project needs"
             )
             
@@ -378,22 +572,27 @@ Focus on delivering a working solution that meets the user's needs.""",
         
         return [fallback_agent]
     
-    def convert_to_agent_configs(self, claude_agents: List[ClaudeCreatedAgent]) -> List[AgentConfig]:
-        """Convert Claude-created agents to AgentConfig objects.
+    def convert_to_agent_configs(
+        self, claude_agents: List[ClaudeCreatedAgent]
+    ) -> List[AgentConfigFast]:
+        """Convert Claude-created agents to agent configuration objects.
         
         Args:
             claude_agents: List of Claude-created agents
             
         Returns:
-            List of AgentConfig objects
+            List of AgentConfigFast objects
         """
         configs = []
         
         for agent in claude_agents:
-            config = AgentConfig(
-                name=agent.name,
-                description=f"{agent.description} (Claude-created)",
-                tools=agent.tools or ["Read", "Write", "Edit", "TodoWrite"],
+            # Front matter written by Claude is not validated, and
+            # AgentConfigFast skips validation, so fix up the types here
+            description = _normalize_text(agent.description, "Claude-created agent")
+            config = AgentConfigFast(
+                name=_normalize_text(agent.name, Path(agent.file_path).stem),
+                description=f"{description} (Claude-created)",
+                tools=_normalize_tools(agent.tools),
                 parallelism=4,
                 patterns=["claude-created", "natural"],
                 content=agent.system_prompt,
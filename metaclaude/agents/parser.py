@@ -1,8 +1,13 @@
 """Agent configuration parser for MetaClaude."""
 
+import os
+import re
+import sys
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pydantic import BaseModel, Field, validator
 
 from ..utils.errors import MetaClaudeAgentError
@@ -10,6 +15,44 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
+
+logger.debug(f"Agent front-matter YAML loader: {SafeLoader.__name__}")
+
+# Opening "---" line, front-matter, closing "---" line, then the body
+_FRONTMATTER_RE = re.compile(
+    r"---[ \t]*\r?\n(.*?)^---[ \t]*\r?$\n?(.*)\Z", re.DOTALL | re.MULTILINE
+)
+
+_VALID_TOOLS = frozenset({
+    "Bash", "Read", "Write", "Edit", "MultiEdit", "Glob", "Grep", "LS",
+    "WebFetch", "WebSearch", "TodoWrite", "Task", "NotebookRead", "NotebookEdit",
+})
+_VALID_PATTERNS = frozenset({"planner", "coder", "tester", "researcher"})
+# Tool groups that grant one capability; each check is one pass over the tools list
+_WRITE_TOOLS = frozenset({"Write", "Edit"})
+_WEB_TOOLS = frozenset({"WebSearch", "WebFetch"})
+
+
+def split_front_matter(content: str, pos: int = 0) -> Optional[Tuple[str, str]]:
+    """Split a markdown document into YAML front-matter and body.
+    
+    Args:
+        content: Document text with a ``---`` line at ``pos``
+        pos: Offset where the opening ``---`` line starts
+        
+    Returns:
+        Tuple of (front_matter, body), both stripped, or None if the
+        document has no complete front-matter block
+    """
+    match = _FRONTMATTER_RE.match(content, pos)
+    if match is None:
+        return None
+    return match.group(1).strip(), match.group(2).strip()
+
 
 class AgentConfig(BaseModel):
     """Pydantic model for agent configuration."""
@@ -37,13 +80,8 @@ class AgentConfig(BaseModel):
         if not v:
             raise ValueError("At least one tool must be specified")
         
-        valid_tools = {
-            "Bash", "Read", "Write", "Edit", "MultiEdit", "Glob", "Grep", "LS",
-            "WebFetch", "WebSearch", "TodoWrite", "Task", "NotebookRead", "NotebookEdit"
-        }
-        
         for tool in v:
-            if tool not in valid_tools:
+            if tool not in _VALID_TOOLS:
                 logger.warning(f"Unknown tool specified: {tool}")
         
         return v
@@ -54,20 +92,42 @@ class AgentConfig(BaseModel):
         if v is None:
             return []
         
-        valid_patterns = {"planner", "coder", "tester", "researcher"}
-        
         for pattern in v:
-            if pattern not in valid_patterns:
+            if pattern not in _VALID_PATTERNS:
                 logger.warning(f"Unknown pattern specified: {pattern}")
         
         return v
 
 
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class AgentConfigFast:
+    """Lightweight agent configuration for trusted, internally generated agents.
+    
+    Mirrors the fields of AgentConfig without running validators, so it
+    should only be built from data that is already known to be valid.
+    Files read from disk go through AgentConfig instead.
+    """
+    
+    name: str
+    description: str
+    tools: List[str]
+    content: str
+    file_path: str
+    parallelism: int = 1
+    patterns: List[str] = field(default_factory=list)
+
+
 class AgentParser:
     """Parser for agent configuration files."""
     
     def __init__(self):
         """Initialize agent parser."""
+        # Parsed configs keyed by file path, tagged with (st_mtime_ns, st_size)
+        self._cache: Dict[Path, Tuple[int, int, AgentConfig]] = {}
         logger.info("AgentParser initialized")
     
     def parse_agent_file(self, agent_file: Path) -> AgentConfig:
@@ -88,22 +148,21 @@ class AgentParser:
             if not agent_file.exists():
                 raise MetaClaudeAgentError(f"Agent file does not exist: {agent_file}")
             
-            content = agent_file.read_text(encoding="utf-8")
+            content = agent_file.read_bytes().decode("utf-8")
             
             # Split YAML front-matter from content
             if not content.startswith("---"):
                 raise MetaClaudeAgentError(f"Missing YAML front-matter in {agent_file}")
             
-            parts = content.split("---", 2)
-            if len(parts) < 3:
+            parts = split_front_matter(content)
+            if parts is None:
                 raise MetaClaudeAgentError(f"Invalid front-matter format in {agent_file}")
             
-            front_matter = parts[1].strip()
-            agent_content = parts[2].strip()
+            front_matter, agent_content = parts
             
             # Parse YAML front-matter
             try:
-                metadata = yaml.safe_load(front_matter)
+                metadata = yaml.load(front_matter, Loader=SafeLoader)
                 if not isinstance(metadata, dict):
                     raise MetaClaudeAgentError(f"Front-matter must be a dictionary in {agent_file}")
             except yaml.YAMLError as e:
@@ -145,10 +204,39 @@ class AgentParser:
                 return {}
             
             agents = {}
+            agent_files = sorted(agents_dir.glob("*.md"))
+            
+            # Reuse configs for files unchanged since they were last parsed
+            stats = {}
+            cached = {}
+            for agent_file in agent_files:
+                try:
+                    st = agent_file.stat()
+                except OSError as e:
+                    # Vanished or unreadable since the glob; parse_agent_file reports it
+                    logger.debug(f"Could not stat agent file {agent_file}: {e}")
+                    continue
+                stats[agent_file] = (st.st_mtime_ns, st.st_size)
+                entry = self._cache.get(agent_file)
+                if entry is not None and entry[:2] == stats[agent_file]:
+                    cached[agent_file] = entry[2]
+            
+            # Reading and parsing is I/O-bound, so overlap it across threads
+            misses = [f for f in agent_files if f not in cached]
+            futures = {}
+            if misses:
+                max_workers = max(1, min(len(misses), os.cpu_count() or 1))
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    futures = {f: pool.submit(self.parse_agent_file, f) for f in misses}
             
-            for agent_file in agents_dir.glob("*.md"):
+            for agent_file in agent_files:
                 try:
-                    agent_config = self.parse_agent_file(agent_file)
+                    if agent_file in cached:
+                        agent_config = cached[agent_file]
+                    else:
+                        agent_config = futures[agent_file].result()
+                        if agent_file in stats:
+                            self._cache[agent_file] = (*stats[agent_file], agent_config)
                     
                     # Check for duplicate names
                     if agent_config.name in agents:
@@ -222,8 +310,8 @@ class AgentParser:
             "patterns": agent_config.patterns,
             "can_execute_bash": "Bash" in agent_config.tools,
             "can_read_files": "Read" in agent_config.tools,
-            "can_write_files": "Write" in agent_config.tools or "Edit" in agent_config.tools,
-            "can_search_web": "WebSearch" in agent_config.tools or "WebFetch" in agent_config.tools,
+            "can_write_files": not _WRITE_TOOLS.isdisjoint(agent_config.tools),
+            "can_search_web": not _WEB_TOOLS.isdisjoint(agent_config.tools),
             "can_manage_tasks": "TodoWrite" in agent_config.tools,
             "supports_planning": "planner" in agent_config.patterns,
             "supports_coding": "coder" in agent_config.patterns,
@@ -1,20 +1,397 @@
 """Agent selector and augmenter for MetaClaude."""
 
+import hashlib
+import json
+import os
 import re
+import sys
+import threading
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Pattern,
+    Set,
+    Optional,
+    Tuple,
+)
 from collections import defaultdict
 
-from .parser import AgentConfig, AgentParser
+import pydantic
+
+from .. import __version__
+from .parser import _DATACLASS_SLOTS, AgentConfig, AgentParser
 from ..utils.errors import MetaClaudeAgentError
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+# Word-like tokens, keeping compounds such as "next.js", "ci/cd" or "real-time" whole
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:[./-][a-z0-9+#]+)*")
+_COMPOUND_SEPARATOR_RE = re.compile(r"[./-]")
+
+# Maximum number of ideas remembered by the per-selector result caches
+_CACHE_SIZE = 256
+
+
+
+def _agents_cache_dir() -> Optional[Path]:
+    """Directory for the parsed agents cache, or None if there is no home to put it in.
+    
+    Resolved on each use rather than at import, so a missing HOME only disables
+    the cache instead of breaking the import.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = Path.home() / ".cache"
+        except (RuntimeError, KeyError) as e:
+            logger.debug(f"Agents cache disabled, no home directory: {e}")
+            return None
+    return Path(cache_home) / "metaclaude"
+
+
+@lru_cache(maxsize=None)
+def _agent_schema_fingerprint() -> str:
+    """Describe the AgentConfig fields, so cache entries from another schema never match."""
+    return repr(sorted((name, repr(info)) for name, info in AgentConfig.model_fields.items()))
+
+
+def _remember(cache: Dict[Hashable, Any], key: Hashable, value: Any) -> None:
+    """Store a value in a bounded cache, evicting the oldest entry when full."""
+    if len(cache) >= _CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def _tokenize(text: str) -> FrozenSet[str]:
+    """Split lowercase text into the tokens single-word keywords are matched against.
+    
+    Compound tokens also contribute their parts ("node.js" -> "node", "js"),
+    and tokens ending in "s" also contribute the singular form.
+    """
+    tokens = set()
+    for token in _TOKEN_RE.findall(text):
+        tokens.add(token)
+        if len(token) > 3 and token.endswith("s"):
+            tokens.add(token[:-1])
+        if _COMPOUND_SEPARATOR_RE.search(token):
+            tokens.update(_COMPOUND_SEPARATOR_RE.split(token))
+    return frozenset(tokens)
+
+
+@dataclass(frozen=True)
+class _IdeaView:
+    """An idea string together with the derived forms keyword matching needs."""
+    
+    idea: str
+    lower: str
+    tokens: FrozenSet[str]
+    word_count: int
+    
+    @classmethod
+    def of(cls, idea: str) -> "_IdeaView":
+        """Build the view, lowercasing and tokenizing the idea exactly once."""
+        lower = idea.lower()
+        return cls(idea=idea, lower=lower, tokens=_tokenize(lower), word_count=len(idea.split()))
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class IdeaAnalysis:
+    """Keyword analysis of a project idea."""
+    
+    domains: Tuple[str, ...]
+    technologies: Tuple[str, ...]
+    complexity: str
+    project_type: str
+    word_count: int
+    has_specific_requirements: bool
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex matching any of the keywords, with shared prefixes merged.
+    
+    Keywords are inserted into a character trie that is rendered as nested
+    groups, so the regex engine walks each common prefix once instead of
+    retrying every alternative. Optional suffixes are greedy, so the longest
+    keyword wins at any given position.
+    
+    Args:
+        keywords: Keyword phrases
+        
+    Returns:
+        Regex source string
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def render(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+    
+    return render(trie)
+
+
+def _compile_keyword_scanner(
+    keywords: Iterable[str],
+) -> Tuple[Pattern[str], Dict[str, Tuple[str, ...]]]:
+    """Compile keywords into a single regex that finds every occurrence in one pass.
+    
+    The pattern is a zero-width lookahead over a trie-shaped regex tried at
+    each position, so each match reports the longest keyword starting there.
+    Shorter keywords that are prefixes of it start at the same position too,
+    so the returned closure maps every keyword to itself plus those prefixes.
+    
+    Args:
+        keywords: Lowercase keyword phrases
+        
+    Returns:
+        Tuple of (compiled pattern, keyword -> keywords it implies)
+    """
+    unique = sorted(set(keywords), key=lambda kw: (-len(kw), kw))
+    pattern = re.compile("(?=(" + _trie_pattern(unique) + "))")
+    closure = {kw: tuple(other for other in unique if kw.startswith(other)) for kw in unique}
+    return pattern, closure
+
+
+def _keyword_group_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex matching keywords with the same semantics as the scanner.
+    
+    Single-word keywords only match whole tokens (optionally with a plural
+    "s" when at least three characters long), while phrases match anywhere,
+    mirroring how analyze_idea collects its hits.
+    
+    Args:
+        keywords: Lowercase keyword phrases
+        
+    Returns:
+        Regex source string
+    """
+    words = {kw for kw in keywords if _TOKEN_RE.fullmatch(kw)}
+    phrases = set(keywords) - words
+    
+    alternatives = []
+    plural_words = [kw for kw in words if len(kw) >= 3]
+    short_words = [kw for kw in words if len(kw) < 3]
+    if plural_words:
+        alternatives.append(f"(?:{_trie_pattern(plural_words)})s?")
+    if short_words:
+        alternatives.append(_trie_pattern(short_words))
+    if alternatives:
+        alternatives = [r"(?<![a-z0-9+#])(?:" + "|".join(alternatives) + r")(?![a-z0-9+#])"]
+    if phrases:
+        alternatives.append(_trie_pattern(phrases))
+    return "|".join(alternatives)
+
+
+# Keywords signalling each domain
+_DOMAIN_KEYWORDS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    "web": frozenset({
+        "web", "website", "frontend", "backend", "fullstack", "react", "vue", "angular",
+        "html", "css", "javascript", "typescript", "node", "express", "api", "rest",
+        "graphql", "next.js", "nuxt", "svelte", "electron"
+    }),
+    "mobile": frozenset({
+        "mobile", "app", "ios", "android", "react native", "flutter", "swift", "kotlin",
+        "xamarin", "cordova", "ionic", "phone", "tablet"
+    }),
+    "ml": frozenset({
+        "machine learning", "ml", "ai", "artificial intelligence", "deep learning",
+        "neural network", "model", "pytorch", "tensorflow", "scikit", "pandas",
+        "numpy", "data science", "prediction", "classification", "regression",
+        "nlp", "computer vision", "cv", "transformers", "bert", "gpt"
+    }),
+    "data": frozenset({
+        "data", "analytics", "database", "sql", "nosql", "mongodb", "postgresql",
+        "mysql", "redis", "elasticsearch", "etl", "pipeline", "warehouse",
+        "bigquery", "spark", "hadoop", "kafka", "airflow"
+    }),
+    "devops": frozenset({
+        "devops", "infrastructure", "deployment", "ci/cd", "docker", "kubernetes",
+        "aws", "azure", "gcp", "cloud", "terraform", "ansible", "jenkins",
+        "github actions", "monitoring", "prometheus", "grafana", "helm"
+    }),
+    "desktop": frozenset({
+        "desktop", "gui", "tkinter", "qt", "gtk", "wpf", "winforms", "electron",
+        "tauri", "native", "cross-platform"
+    }),
+    "game": frozenset({
+        "game", "gaming", "unity", "unreal", "godot", "pygame", "three.js",
+        "webgl", "opengl", "vulkan", "directx", "2d", "3d"
+    }),
+    "blockchain": frozenset({
+        "blockchain", "crypto", "web3", "ethereum", "bitcoin", "solidity",
+        "smart contract", "defi", "nft", "dapp", "metamask"
+    }),
+    "testing": frozenset({
+        "test", "testing", "qa", "quality assurance", "automation", "unit test",
+        "integration test", "e2e", "cypress", "jest", "pytest", "selenium"
+    })
+})
+
+# Agents suited to each technology
+_TECH_STACK_AGENTS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "python": ("ml-dl-engineer", "fullstack-engineer", "qa-engineer"),
+    "javascript": ("fullstack-engineer", "qa-engineer"),
+    "typescript": ("fullstack-engineer", "qa-engineer"),
+    "react": ("fullstack-engineer",),
+    "node": ("fullstack-engineer",),
+    "docker": ("devops-engineer", "fullstack-engineer"),
+    "kubernetes": ("devops-engineer",),
+    "aws": ("devops-engineer",),
+    "terraform": ("devops-engineer",),
+    "pytorch": ("ml-dl-engineer",),
+    "tensorflow": ("ml-dl-engineer",),
+})
+
+# Complexity indicator keywords
+_COMPLEXITY_INDICATORS: FrozenSet[str] = frozenset({
+    "enterprise", "scalable", "distributed", "microservices", "real-time",
+    "high-performance", "machine learning", "ai", "blockchain", "advanced"
+})
+
+# Project type keywords; the type mentioned earliest in the idea wins
+_PROJECT_TYPES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "api": ("api", "rest", "graphql", "backend", "service"),
+    "webapp": ("web app", "website", "frontend", "dashboard"),
+    "mobile_app": ("mobile app", "ios app", "android app"),
+    "desktop_app": ("desktop app", "gui", "application"),
+    "cli": ("cli", "command line", "terminal", "script"),
+    "library": ("library", "package", "module", "sdk"),
+    "data_pipeline": ("pipeline", "etl", "data processing"),
+    "ml_model": ("model", "prediction", "classification", "ml"),
+})
+
+# Recommended agent combinations, most common first
+_AGENT_COMBINATIONS: Tuple[Tuple[str, ...], ...] = (
+    ("fullstack-engineer",),
+    ("fullstack-engineer", "qa-engineer"),
+    ("fullstack-engineer", "devops-engineer"),
+    ("ml-dl-engineer",),
+    ("ml-dl-engineer", "fullstack-engineer"),
+    ("fullstack-engineer", "qa-engineer", "devops-engineer"),
+    ("ml-dl-engineer", "devops-engineer"),
+    ("devops-engineer",),
+    ("qa-engineer",),
+    ("ml-dl-engineer", "qa-engineer"),
+)
+
+# Guidance appended to augmented agents for each domain
+_WEB_GUIDANCE = (
+    "- Focus on responsive design and modern web standards\n"
+    "- Implement proper SEO and accessibility features\n"
+    "- Use modern build tools and optimization techniques\n"
+)
+_ML_GUIDANCE = (
+    "- Prioritize data quality and model validation\n"
+    "- Implement proper experiment tracking and versioning\n"
+    "- Consider model deployment and monitoring needs\n"
+)
+_DEVOPS_GUIDANCE = (
+    "- Focus on automation and in-frastructure as code\n"
+    "- Implement comprehensive monitoring and alerting\n"
+    "- Ensure security and compliance requirements\n"
+)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _build_common_sections(
+    analysis_key: Tuple[Tuple[str, ...], Tuple[str, ...], str, str],
+    custom_key: Tuple[Tuple[str, Any], ...],
+) -> str:
+    """Build the sections appended to every augmented agent's content.
+    
+    Args:
+        analysis_key: Domains, technologies, complexity and project type
+        custom_key: Custom requirement items
+        
+    Returns:
+        Guidance, custom requirement and project context sections
+    """
+    domains, technologies, complexity, project_type = analysis_key
+    parts = []
+    
+    # Add domain-specific guidance
+    if domains:
+        parts.append("\n\n## Domain-Specific Guidance\n\n")
+        if "web" in domains:
+            parts.append(_WEB_GUIDANCE)
+        if "ml" in domains:
+            parts.append(_ML_GUIDANCE)
+        if "devops" in domains:
+            parts.append(_DEVOPS_GUIDANCE)
+    
+    # Add custom requirements
+    if custom_key:
+        parts.append("\n\n## Custom Requirements\n\n")
+        parts.extend(f"- **{key.title()}**: {value}\n" for key, value in custom_key)
+    
+    # Add project context
+    parts.append("\n\n## Project Context\n\n")
+    parts.append(f"- **Domains**: {', '.join(domains)}\n")
+    parts.append(f"- **Technologies**: {', '.join(technologies)}\n")
+    parts.append(f"- **Complexity**: {complexity}\n")
+    parts.append(f"- **Project Type**: {project_type}\n")
+    
+    return "".join(parts)
+
+
+def _common_sections(
+    analysis: IdeaAnalysis,
+    custom_requirements: Optional[Dict[str, Any]],
+) -> str:
+    """Get the shared augmentation sections for an analysis and custom requirements."""
+    analysis_key = (
+        analysis.domains,
+        analysis.technologies,
+        analysis.complexity,
+        analysis.project_type,
+    )
+    custom_key = tuple(custom_requirements.items()) if custom_requirements else ()
+    try:
+        return _build_common_sections(analysis_key, custom_key)
+    except TypeError:
+        # Unhashable requirement values cannot be cached
+        return _build_common_sections.__wrapped__(analysis_key, custom_key)
+
+
+def _apply_sections(base_content: str, common: str) -> str:
+    """Append the shared sections to an agent's base content."""
+    return base_content + common
+
+
 class AgentSelector:
     """Selects and augments agents based on project requirements."""
     
+    # Agents suited to each detected domain
+    _DOMAIN_AGENT_MAP: Dict[str, Tuple[str, ...]] = {
+        "web": ("fullstack-engineer",),
+        "mobile": ("fullstack-engineer",),
+        "ml": ("ml-dl-engineer",),
+        "data": ("ml-dl-engineer", "fullstack-engineer"),
+        "devops": ("devops-engineer",),
+        "desktop": ("fullstack-engineer",),
+        "game": ("fullstack-engineer",),
+        "blockchain": ("fullstack-engineer",),
+        "testing": ("qa-engineer",),
+    }
+    
     def __init__(self, agents_dir: Path):
         """Initialize agent selector.
         
@@ -23,109 +400,230 @@ class AgentSelector:
         """
         self.agents_dir = agents_dir
         self.parser = AgentParser()
-        self.available_agents: Dict[str, AgentConfig] = {}
-        self._load_agents()
-        
-        # Domain keyword mappings
-        self.domain_keywords = {
-            "web": [
-                "web", "website", "frontend", "backend", "fullstack", "react", "vue", "angular",
-                "html", "css", "javascript", "typescript", "node", "express", "api", "rest",
-                "graphql", "next.js", "nuxt", "svelte", "electron"
-            ],
-            "mobile": [
-                "mobile", "app", "ios", "android", "react native", "flutter", "swift", "kotlin",
-                "xamarin", "cordova", "ionic", "phone", "tablet"
-            ],
-            "ml": [
-                "machine learning", "ml", "ai", "artificial intelligence", "deep learning",
-                "neural network", "model", "pytorch", "tensorflow", "scikit", "pandas",
-                "numpy", "data science", "prediction", "classification", "regression",
-                "nlp", "computer vision", "cv", "transformers", "bert", "gpt"
-            ],
-            "data": [
-                "data", "analytics", "database", "sql", "nosql", "mongodb", "postgresql",
-                "mysql", "redis", "elasticsearch", "etl", "pipeline", "warehouse",
-                "bigquery", "spark", "hadoop", "kafka", "airflow"
-            ],
-            "devops": [
-                "devops", "infrastructure", "deployment", "ci/cd", "docker", "kubernetes",
-                "aws", "azure", "gcp", "cloud", "terraform", "ansible", "jenkins",
-                "github actions", "monitoring", "prometheus", "grafana", "helm"
-            ],
-            "desktop": [
-                "desktop", "gui", "tkinter", "qt", "gtk", "wpf", "winforms", "electron",
-                "tauri", "native", "cross-platform"
-            ],
-            "game": [
-                "game", "gaming", "unity", "unreal", "godot", "pygame", "three.js",
-                "webgl", "opengl", "vulkan", "directx", "2d", "3d"
-            ],
-            "blockchain": [
-                "blockchain", "crypto", "web3", "ethereum", "bitcoin", "solidity",
-                "smart contract", "defi", "nft", "dapp", "metamask"
-            ],
-            "testing": [
-                "test", "testing", "qa", "quality assurance", "automation", "unit test",
-                "integration test", "e2e", "cypress", "jest", "pytest", "selenium"
-            ]
-        }
-        
-        # Technology stack mappings
-        self.tech_stack_agents = {
-            "python": ["ml-dl-engineer", "fullstack-engineer", "qa-engineer"],
-            "javascript": ["fullstack-engineer", "qa-engineer"],
-            "typescript": ["fullstack-engineer", "qa-engineer"],
-            "react": ["fullstack-engineer"],
-            "node": ["fullstack-engineer"],
-            "docker": ["devops-engineer", "fullstack-engineer"],
-            "kubernetes": ["devops-engineer"],
-            "aws": ["devops-engineer"],
-            "terraform": ["devops-engineer"],
-            "pytorch": ["ml-dl-engineer"],
-            "tensorflow": ["ml-dl-engineer"],
+        # Agents are parsed on first use of available_agents
+        self._agents_lock = threading.Lock()
+        
+        # Keyword tables are shared, read-only module constants
+        self.domain_keywords = _DOMAIN_KEYWORDS
+        self.tech_stack_agents = _TECH_STACK_AGENTS
+        self.complexity_indicators = _COMPLEXITY_INDICATORS
+        self.project_types = _PROJECT_TYPES
+        
+        # Single-word keywords are matched against idea tokens with one set
+        # intersection; phrases go through one scanner so an idea is searched once
+        all_keywords = {
+            *(kw for kws in self.domain_keywords.values() for kw in kws),
+            *self.tech_stack_agents,
+            *self.complexity_indicators,
+            *(kw for kws in self.project_types.values() for kw in kws),
         }
+        self._single_word_keywords = frozenset(kw for kw in all_keywords if _TOKEN_RE.fullmatch(kw))
+        self._keyword_re, self._keyword_closure = _compile_keyword_scanner(
+            all_keywords - self._single_word_keywords
+        )
         
-        logger.info(f"AgentSelector initialized with {len(self.available_agents)} agents")
+        # Reverse index so each hit maps straight to the domains it signals
+        kw_to_domains: Dict[str, List[str]] = defaultdict(list)
+        for domain, keywords in self.domain_keywords.items():
+            for keyword in keywords:
+                kw_to_domains[keyword].append(domain)
+        self._kw_to_domains = {kw: tuple(domains) for kw, domains in kw_to_domains.items()}
+        
+        # One search finds the earliest project type keyword, ties going to
+        # the type listed first
+        self._ptype_re = re.compile("|".join(
+            f"(?P<{ptype}>{_keyword_group_pattern(keywords)})"
+            for ptype, keywords in self.project_types.items()
+        ))
+        
+        # Memoized analyze_idea / select_agents results for repeated ideas
+        self._analysis_cache: Dict[str, IdeaAnalysis] = {}
+        self._selection_cache: Dict[Tuple[str, Tuple[str, ...], int], Tuple[AgentConfig, ...]] = {}
+        
+        logger.info(f"AgentSelector initialized for {self.agents_dir}")
+    
+    @cached_property
+    def available_agents(self) -> Dict[str, AgentConfig]:
+        """Agents parsed from the agents directory, loaded on first access."""
+        with self._agents_lock:
+            agents = self.__dict__.get("available_agents")
+            if agents is None:
+                agents = self._load_agents()
+                self.__dict__["available_agents"] = agents
+            return agents
+    
+    @cached_property
+    def _available_combinations(self) -> Tuple[Tuple[str, ...], ...]:
+        """Recommended combinations whose agents are all available."""
+        return tuple(
+            combo for combo in _AGENT_COMBINATIONS
+            if all(agent in self.available_agents for agent in combo)
+        )
+    
+    def preload(self) -> None:
+        """Load available agents now instead of on first use."""
+        self.available_agents
     
-    def _load_agents(self) -> None:
-        """Load available agents from directory."""
+    def _load_agents(self) -> Dict[str, AgentConfig]:
+        """Load available agents from the on-disk cache or the directory."""
         try:
-            self.available_agents = self.parser.parse_agents_directory(self.agents_dir)
-            logger.info(f"Loaded {len(self.available_agents)} agents")
+            cache_path = self._agents_cache_path()
+            agents = self._read_agents_cache(cache_path)
+            if agents is None:
+                agents = self.parser.parse_agents_directory(self.agents_dir)
+                if agents:
+                    self._write_agents_cache(cache_path, agents)
+            logger.info(f"Loaded {len(agents)} agents")
+            return agents
         except Exception as e:
             logger.error(f"Failed to load agents: {e}")
-            self.available_agents = {}
+            return {}
     
-    def analyze_idea(self, idea: str) -> Dict[str, any]:
+    def _agents_cache_path(self) -> Optional[Path]:
+        """Get the cache file for the current state of the agents directory.
+        
+        The key covers the directory, the name, mtime and size of every agent
+        file, the package and pydantic versions and the AgentConfig fields, so
+        any change yields a new cache file.
+        
+        Returns:
+            Path of the JSON cache, or None if caching is not possible
+        """
+        cache_dir = _agents_cache_dir()
+        if cache_dir is None or not self.agents_dir.is_dir():
+            return None
+        
+        state = []
+        try:
+            for agent_file in self.agents_dir.glob("*.md"):
+                st = agent_file.stat()
+                state.append((agent_file.name, st.st_mtime_ns, st.st_size))
+        except OSError as e:
+            # A file vanished mid-scan; parse the directory without the cache
+            logger.debug(f"Skipping agents cache: {e}")
+            return None
+        state.sort()
+        
+        key_parts = (
+            __version__,
+            pydantic.VERSION,
+            _agent_schema_fingerprint(),
+            str(self.agents_dir.resolve()),
+            state,
+        )
+        key = hashlib.sha256(repr(key_parts).encode("utf-8")).hexdigest()[:32]
+        return cache_dir / f"agents-{key}.json"
+    
+    def _read_agents_cache(self, cache_path: Optional[Path]) -> Optional[Dict[str, AgentConfig]]:
+        """Read cached agents, returning None on a miss or unusable cache.
+        
+        The cache holds plain JSON that is validated into AgentConfig again, so
+        a stale or tampered file can at worst cause a fresh parse.
+        """
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, "rb") as f:
+                data = json.load(f)
+            agents = {name: AgentConfig.model_validate(fields) for name, fields in data.items()}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable agents cache {cache_path}: {e}")
+            return None
+        
+        logger.debug(f"Loaded agents from cache: {cache_path}")
+        return agents
+    
+    def _write_agents_cache(
+        self, cache_path: Optional[Path], agents: Dict[str, AgentConfig]
+    ) -> None:
+        """Store parsed agents as JSON, ignoring failures since the cache is optional."""
+        if cache_path is None:
+            return
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            data = {name: agent.model_dump(mode="json") for name, agent in agents.items()}
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Could not write agents cache {cache_path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    def analyze_idea(self, idea: str) -> IdeaAnalysis:
         """Analyze project idea to extract requirements and keywords.
         
+        Results are cached per idea and returned as an immutable IdeaAnalysis.
+        
         Args:
             idea: Project idea/description
             
         Returns:
             Analysis results including domains, technologies, complexity
         """
-        idea_lower = idea.lower()
+        # Interned keys let repeated lookups for the same idea hit on identity
+        idea = sys.intern(idea)
+        cached = self._analysis_cache.get(idea)
+        if cached is not None:
+            return cached
+        
+        analysis = self._analyze_view(_IdeaView.of(idea))
+        _remember(self._analysis_cache, idea, analysis)
+        return analysis
+    
+    def analyze_ideas(self, ideas: Iterable[str]) -> List[IdeaAnalysis]:
+        """Analyze a batch of project ideas.
         
-        # Extract domains
-        detected_domains = set()
-        for domain, keywords in self.domain_keywords.items():
-            if any(keyword in idea_lower for keyword in keywords):
-                detected_domains.add(domain)
+        Duplicate ideas are analyzed once and cached results are reused, so a
+        batch costs one keyword scan per distinct new idea.
+        
+        Args:
+            ideas: Project ideas/descriptions
+            
+        Returns:
+            Analysis results in the same order as ``ideas``
+        """
+        results: Dict[str, IdeaAnalysis] = {}
+        analyses = []
+        for idea in ideas:
+            analysis = results.get(idea)
+            if analysis is None:
+                analysis = results[idea] = self.analyze_idea(idea)
+            analyses.append(analysis)
+        return analyses
+    
+    def _analyze_view(self, view: _IdeaView) -> IdeaAnalysis:
+        """Run keyword analysis on a prepared idea view.
+        
+        Args:
+            view: Idea with its lowercase form precomputed
+            
+        Returns:
+            Immutable analysis results
+        """
+        # Collect every keyword occurring in the idea: whole-token matches for
+        # single words, one scan for multi-word phrases
+        hits = set(view.tokens & self._single_word_keywords)
+        for match in self._keyword_re.finditer(view.lower):
+            hits.update(self._keyword_closure[match.group(1)])
+        
+        # Extract domains, reported in table order
+        found_domains = set()
+        for keyword in hits:
+            found_domains.update(self._kw_to_domains.get(keyword, ()))
+        detected_domains = [domain for domain in self.domain_keywords if domain in found_domains]
         
         # Extract technologies
-        detected_technologies = set()
-        for tech, _ in self.tech_stack_agents.items():
-            if tech in idea_lower:
-                detected_technologies.add(tech)
+        detected_technologies = [tech for tech in self.tech_stack_agents if tech in hits]
         
         # Estimate complexity based on keywords
-        complexity_indicators = [
-            "enterprise", "scalable", "distributed", "microservices", "real-time",
-            "high-performance", "machine learning", "ai", "blockchain", "advanced"
-        ]
-        complexity_score = sum(1 for indicator in complexity_indicators if indicator in idea_lower)
+        complexity_score = len(self.complexity_indicators.intersection(hits))
         
         if complexity_score >= 3:
             complexity = "high"
@@ -135,31 +633,17 @@ class AgentSelector:
             complexity = "low"
         
         # Extract project type
-        project_types = {
-            "api": ["api", "rest", "graphql", "backend", "service"],
-            "webapp": ["web app", "website", "frontend", "dashboard"],
-            "mobile_app": ["mobile app", "ios app", "android app"],
-            "desktop_app": ["desktop app", "gui", "application"],
-            "cli": ["cli", "command line", "terminal", "script"],
-            "library": ["library", "package", "module", "sdk"],
-            "data_pipeline": ["pipeline", "etl", "data processing"],
-            "ml_model": ["model", "prediction", "classification", "ml"],
-        }
-        
-        detected_project_type = "general"
-        for ptype, keywords in project_types.items():
-            if any(keyword in idea_lower for keyword in keywords):
-                detected_project_type = ptype
-                break
-        
-        analysis = {
-            "domains": list(detected_domains),
-            "technologies": list(detected_technologies),
-            "complexity": complexity,
-            "project_type": detected_project_type,
-            "word_count": len(idea.split()),
-            "has_specific_requirements": len(detected_domains) > 0 or len(detected_technologies) > 0,
-        }
+        ptype_match = self._ptype_re.search(view.lower)
+        detected_project_type = ptype_match.lastgroup if ptype_match else "general"
+        
+        analysis = IdeaAnalysis(
+            domains=tuple(detected_domains),
+            technologies=tuple(detected_technologies),
+            complexity=complexity,
+            project_type=detected_project_type,
+            word_count=view.word_count,
+            has_specific_requirements=len(detected_domains) > 0 or len(detected_technologies) > 0,
+        )
         
         logger.info(f"Idea analysis: {analysis}")
         return analysis
@@ -180,56 +664,84 @@ class AgentSelector:
         Returns:
             List of selected agent configurations
         """
+        # Forced agents alone can fill the selection, making the analysis moot
+        if force_agents and max_agents > 0:
+            forced = [
+                self.available_agents[agent_name]
+                for agent_name in dict.fromkeys(force_agents)
+                if agent_name in self.available_agents
+            ]
+            if len(forced) >= max_agents:
+                for agent_name in force_agents:
+                    if agent_name not in self.available_agents:
+                        logger.warning(f"Forced agent not available: {agent_name}")
+                result_configs = forced[:max_agents]
+                logger.info(f"Selected forced agents: {[agent.name for agent in result_configs]}")
+                return result_configs
+        
+        cache_key = (idea, tuple(force_agents or ()), max_agents)
+        cached = self._selection_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        result_configs, _ = self._select_with_analysis(idea, force_agents, max_agents)
+        _remember(self._selection_cache, cache_key, tuple(result_configs))
+        return result_configs
+    
+    def _select_with_analysis(
+        self,
+        idea: str,
+        force_agents: Optional[List[str]],
+        max_agents: int,
+    ) -> Tuple[List[AgentConfig], IdeaAnalysis]:
+        """Select agents and return the idea analysis the selection was based on.
+        
+        Args:
+            idea: Project idea/description
+            force_agents: List of agent names to force include
+            max_agents: Maximum number of agents to select
+            
+        Returns:
+            Tuple of (selected agent configurations, idea analysis)
+        """
         analysis = self.analyze_idea(idea)
-        selected_agent_names = set()
+        # Insertion-ordered dict used as an ordered set, so earlier (higher
+        # priority) picks survive the max_agents cut
+        selected_agent_names: Dict[str, None] = {}
         
         # Add forced agents
         if force_agents:
             for agent_name in force_agents:
                 if agent_name in self.available_agents:
-                    selected_agent_names.add(agent_name)
+                    selected_agent_names[agent_name] = None
                 else:
                     logger.warning(f"Forced agent not available: {agent_name}")
         
         # Domain-based selection
-        domain_agent_map = {
-            "web": ["fullstack-engineer"],
-            "mobile": ["fullstack-engineer"],
-            "ml": ["ml-dl-engineer"],
-            "data": ["ml-dl-engineer", "fullstack-engineer"],
-            "devops": ["devops-engineer"],
-            "desktop": ["fullstack-engineer"],
-            "game": ["fullstack-engineer"],
-            "blockchain": ["fullstack-engineer"],
-            "testing": ["qa-engineer"],
-        }
-        
-        for domain in analysis["domains"]:
-            if domain in domain_agent_map:
-                selected_agent_names.update(domain_agent_map[domain])
+        for domain in analysis.domains:
+            selected_agent_names.update(dict.fromkeys(self._DOMAIN_AGENT_MAP.get(domain, ())))
         
         # Technology-based selection
-        for tech in analysis["technologies"]:
-            if tech in self.tech_stack_agents:
-                selected_agent_names.update(self.tech_stack_agents[tech])
+        for tech in analysis.technologies:
+            selected_agent_names.update(dict.fromkeys(self.tech_stack_agents.get(tech, ())))
         
         # Complexity-based selection
-        if analysis["complexity"] == "high":
+        if analysis.complexity == "high":
             # High complexity projects need more specialized agents
-            selected_agent_names.add("devops-engineer")
-            selected_agent_names.add("qa-engineer")
-        elif analysis["complexity"] == "medium":
+            selected_agent_names["devops-engineer"] = None
+            selected_agent_names["qa-engineer"] = None
+        elif analysis.complexity == "medium":
             # Medium complexity might need QA
             if len(selected_agent_names) < max_agents:
-                selected_agent_names.add("qa-engineer")
+                selected_agent_names["qa-engineer"] = None
         
         # Default fallback
         if not selected_agent_names:
-            selected_agent_names.add("fullstack-engineer")
+            selected_agent_names["fullstack-engineer"] = None
         
         # Always include QA for substantial projects
-        if analysis["word_count"] > 20 and "qa-engineer" not in selected_agent_names:
-            selected_agent_names.add("qa-engineer")
+        if analysis.word_count > 20:
+            selected_agent_names["qa-engineer"] = None
         
         # Limit to max_agents
         result_names = list(selected_agent_names)[:max_agents]
@@ -246,13 +758,15 @@ class AgentSelector:
         ]
         
         logger.info(f"Selected agents: {[agent.name for agent in result_configs]}")
-        return result_configs
+        return result_configs, analysis
     
     def augment_agents(
         self,
         selected_agents: List[str],
         idea: str,
         custom_requirements: Optional[Dict[str, any]] = None,
+        *,
+        analysis: Optional[IdeaAnalysis] = None,
     ) -> Dict[str, AgentConfig]:
         """Augment selected agents with custom requirements.
         
@@ -260,12 +774,17 @@ class AgentSelector:
             selected_agents: List of selected agent names
             idea: Project idea for context
             custom_requirements: Custom requirements for agents
+            analysis: Analysis of ``idea`` if the caller already has one
             
         Returns:
             Dictionary of augmented agent configurations
         """
         augmented_agents = {}
-        analysis = self.analyze_idea(idea)
+        if analysis is None:
+            analysis = self.analyze_idea(idea)
+        
+        # The appended sections are the same for every agent, so build them once
+        common = _common_sections(analysis, custom_requirements)
         
         for agent_name in selected_agents:
             if agent_name not in self.available_agents:
@@ -276,20 +795,11 @@ class AgentSelector:
             base_config = self.available_agents[agent_name]
             
             # Create augmented content
-            augmented_content = self._augment_agent_content(
-                base_config, analysis, custom_requirements
-            )
+            augmented_content = _apply_sections(base_config.content, common)
             
-            # Create new config with augmented content
-            augmented_config = AgentConfig(
-                name=base_config.name,
-                description=base_config.description,
-                tools=base_config.tools,
-                parallelism=base_config.parallelism,
-                patterns=base_config.patterns,
-                content=augmented_content,
-                file_path=base_config.file_path,
-            )
+            # Copy the already validated config, swapping in the augmented content
+            # without re-running the field validators
+            augmented_config = base_config.model_copy(update={"content": augmented_content})
             
             augmented_agents[agent_name] = augmented_config
             logger.debug(f"Augmented agent: {agent_name}")
@@ -300,7 +810,7 @@ class AgentSelector:
     def _augment_agent_content(
         self,
         agent_config: AgentConfig,
-        analysis: Dict[str, any],
+        analysis: IdeaAnalysis,
         custom_requirements: Optional[Dict[str, any]] = None,
     ) -> str:
         """Augment agent content with project-specific information.
@@ -313,47 +823,8 @@ class AgentSelector:
         Returns:
             Augmented agent content
         """
-        base_content = agent_config.content
-        
-        # Add project context
-        context_section = "\n\n## Project Context\n\n"
-        context_section += f"- **Domains**: {', '.join(analysis['domains'])}\n"
-        context_section += f"- **Technologies**: {', '.join(analysis['technologies'])}\n"
-        context_section += f"- **Complexity**: {analysis['complexity']}\n"
-        context_section += f"- **Project Type**: {analysis['project_type']}\n"
-        
-        # Add domain-specific guidance
-        if analysis["domains"]:
-            guidance_section = "\n\n## Domain-Specific Guidance\n\n"
-            
-            if "web" in analysis["domains"]:
-                guidance_section += "- Focus on responsive design and modern web standards\n"
-                guidance_section += "- Implement proper SEO and accessibility features\n"
-                guidance_section += "- Use modern build tools and optimization techniques\n"
-            
-            if "ml" in analysis["domains"]:
-                guidance_section += "- Prioritize data quality and model validation\n"
-                guidance_section += "- Implement proper experiment tracking and versioning\n"
-                guidance_section += "- Consider model deployment and monitoring needs\n"
-            
-            if "devops" in analysis["domains"]:
-                guidance_section += "- Focus on automation and in-frastructure as code\n"
-                guidance_section += "- Implement comprehensive monitoring and alerting\n"
-                guidance_section += "- Ensure security and compliance requirements\n"
-            
-            base_content += guidance_section
-        
-        # Add custom requirements
-        if custom_requirements:
-            custom_section = "\n\n## Custom Requirements\n\n"
-            for key, value in custom_requirements.items():
-                custom_section += f"- **{key.title()}**: {value}\n"
-            base_content += custom_section
-        
-        # Add project context
-        base_content += context_section
-        
-        return base_content
+        sections = _common_sections(analysis, custom_requirements)
+        return _apply_sections(agent_config.content, sections)
     
     def get_agent_combinations(self, max_combinations: int = 10) -> List[Tuple[str, ...]]:
         """Get recommended agent combinations.
@@ -364,26 +835,7 @@ class AgentSelector:
         Returns:
             List of agent combination tuples
         """
-        combinations = [
-            ("fullstack-engineer",),
-            ("fullstack-engineer", "qa-engineer"),
-            ("fullstack-engineer", "devops-engineer"),
-            ("ml-dl-engineer",),
-            ("ml-dl-engineer", "fullstack-engineer"),
-            ("fullstack-engineer", "qa-engineer", "devops-engineer"),
-            ("ml-dl-engineer", "devops-engineer"),
-            ("devops-engineer",),
-            ("qa-engineer",),
-            ("ml-dl-engineer", "qa-engineer"),
-        ]
-        
-        # Filter to only include available agents
-        available_combinations = []
-        for combo in combinations:
-            if all(agent in self.available_agents for agent in combo):
-                available_combinations.append(combo)
-        
-        return available_combinations[:max_combinations]
+        return list(self._available_combinations[:max_combinations])
     
     def validate_agent_selection(self, selected_agents: List[str]) -> List[str]:
         """Validate agent selection and return any issues.
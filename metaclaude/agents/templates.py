@@ -1,25 +1,96 @@
 """Agent template system for VCC patterns."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from enum import Enum
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Number of distinct contexts remembered per rendered prompt
+_PROMPT_CACHE_SIZE = 256
 
-class AgentPattern(Enum):
-    """Enumeration of agent patterns."""
+
+def _cached_render(render: Callable[..., str], *args: Any) -> str:
+    """Render a prompt through its cache, bypassing it for unhashable values."""
+    try:
+        return render(*args)
+    except TypeError:
+        return render.__wrapped__(*args)
+
+
+def get_static_prompt_tail(tail_id: str) -> str:
+    """Get the static part of an agent system prompt.
+    
+    Args:
+        tail_id: Tail id returned by generate_system_prompt_parts
+        
+    Returns:
+        Static prompt tail
+        
+    Raises:
+        KeyError: If the tail id is unknown
+    """
+    return _STATIC_PROMPT_TAILS[tail_id]
+
+
+def _normalize_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a prompt context so templates can read it without recomputing.
+    
+    Domain and technology lists are joined once and defaults are applied.
+    Already normalized contexts are returned unchanged.
+    
+    Args:
+        context: Raw or normalized context for prompt generation
+        
+    Returns:
+        Context with ``domains_str``, ``technologies_str``, ``complexity``
+        and ``project_type`` set
+    """
+    if "domains_str" in context:
+        return context
+    
+    domains = context.get("domains", [])
+    technologies = context.get("technologies", [])
+    return {
+        **context,
+        "domains_str": ", ".join(domains) if domains else "General",
+        "technologies_str": ", ".join(technologies) if technologies else "To be determined",
+        "complexity": context.get("complexity", "medium"),
+        "project_type": context.get("project_type", "general"),
+    }
+
+
+class AgentPattern(str, Enum):
+    """Enumeration of agent patterns.
+    
+    Members are strings, so they compare and hash equal to their names.
+    """
     PLANNER = "planner"
     CODER = "coder"
     TESTER = "tester"
     RESEARCHER = "researcher"
 
 
+# Plain-str pattern names (safe for YAML dumping) and section titles
+_PATTERN_VALUE: Dict[AgentPattern, str] = {pattern: pattern.value for pattern in AgentPattern}
+_PATTERN_TITLE: Dict[AgentPattern, str] = {
+    pattern: pattern.value.title() for pattern in AgentPattern
+}
+
+
 class BaseAgentTemplate(ABC):
     """Base class for agent templates."""
     
+    # patterns is class-level only, so it is not a slot
+    __slots__ = ("name", "description", "tools", "parallelism")
+    
+    # Tools and patterns of this agent type, shared by all instances
+    _DEFAULT_TOOLS: Tuple[str, ...] = ()
+    patterns: Tuple[str, ...] = ()
+    
     def __init__(self, name: str, description: str):
         """Initialize base agent template.
         
@@ -29,16 +100,24 @@ class BaseAgentTemplate(ABC):
         """
         self.name = name
         self.description = description
-        self.tools = self._get_default_tools()
+        self.tools = self._DEFAULT_TOOLS
         self.parallelism = 1
-        self.patterns = []
     
     @abstractmethod
-    def _get_default_tools(self) -> List[str]:
-        """Get default tools for this agent type."""
+    def generate_system_prompt_parts(self, context: Dict[str, Any]) -> Tuple[str, str]:
+        """Generate the system prompt as a context-dependent head and static tail.
+        
+        The tail never varies with the context, so callers sending prompts to
+        an LLM with prompt caching can treat it as reusable.
+        
+        Args:
+            context: Context information for prompt generation
+            
+        Returns:
+            Tuple of (head, static tail id for get_static_prompt_tail)
+        """
         pass
     
-    @abstractmethod
     def generate_system_prompt(self, context: Dict[str, Any]) -> str:
         """Generate system prompt for the agent.
         
@@ -48,41 +127,25 @@ class BaseAgentTemplate(ABC):
         Returns:
             Generated system prompt
         """
-        pass
+        head, tail_id = self.generate_system_prompt_parts(context)
+        return head + _STATIC_PROMPT_TAILS[tail_id]
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert agent template to dictionary."""
+        """Convert agent template to dictionary.
+        
+        Built fresh on every call, with tools and patterns as new lists, so
+        callers may mutate the result.
+        """
         return {
             "name": self.name,
             "description": self.description,
-            "tools": self.tools,
+            "tools": list(self.tools),
             "parallelism": self.parallelism,
-            "patterns": self.patterns,
+            "patterns": list(self.patterns),
         }
 
 
-class PlannerAgentTemplate(BaseAgentTemplate):
-    """Template for planner agents."""
-    
-    def __init__(self, name: str = "planner", description: str = "Strategic planner for large unknown scope projects"):
-        super().__init__(name, description)
-        self.patterns = [AgentPattern.PLANNER.value]
-        self.parallelism = 1
-    
-    def _get_default_tools(self) -> List[str]:
-        """Get default tools for planner agent."""
-        return [
-            "Read", "Write", "Edit", "Glob", "Grep", "LS", 
-            "WebFetch", "WebSearch", "TodoWrite"
-        ]
-    
-    def generate_system_prompt(self, context: Dict[str, Any]) -> str:
-        """Generate system prompt for planner agent."""
-        domains = context.get("domains", [])
-        complexity = context.get("complexity", "medium")
-        project_type = context.get("project_type", "general")
-        
-        prompt = f"""You are a strategic planner agent specialized in breaking down complex software projects into manageable phases and tasks.
+_PLANNER_PROMPT_HEAD = """You are a strategic planner agent specialized in breaking down complex software projects into manageable phases and tasks.
 
 ## Your Role
 - Analyze project requirements and scope
@@ -92,9 +155,11 @@ class PlannerAgentTemplate(BaseAgentTemplate):
 - Resource allocation and timeline estimation
 
 ## Project Context
-- Domains: {', '.join(domains) if domains else 'General'}
+- Domains: {domains}
 - Complexity: {complexity}
-- Project Type: {project_type}
+- Project Type: {project_type}"""
+
+_PLANNER_PROMPT_TAIL = """
 
 ## Planning Approach
 1. **Requirements Analysis**: Thoroughly understand project goals and constraints
@@ -112,31 +177,53 @@ class PlannerAgentTemplate(BaseAgentTemplate):
 - Resource requirements and timeline estimates
 
 Focus on creating actionable, detailed plans that other agents can execute efficiently."""
-        
-        return prompt
 
 
-class CoderAgentTemplate(BaseAgentTemplate):
-    """Template for coder agents."""
+@lru_cache(maxsize=_PROMPT_CACHE_SIZE)
+def _render_planner_head(domains: str, complexity: str, project_type: str) -> str:
+    """Render the context-dependent head of the planner system prompt."""
+    return _PLANNER_PROMPT_HEAD.format_map({
+        "domains": domains,
+        "complexity": complexity,
+        "project_type": project_type,
+    })
+
+
+class PlannerAgentTemplate(BaseAgentTemplate):
+    """Template for planner agents."""
     
-    def __init__(self, name: str = "coder", description: str = "Implementation specialist for syntactically correct code"):
-        super().__init__(name, description)
-        self.patterns = [AgentPattern.CODER.value]
-        self.parallelism = 3
+    __slots__ = ()
     
-    def _get_default_tools(self) -> List[str]:
-        """Get default tools for coder agent."""
-        return [
-            "Bash", "Read", "Write", "Edit", "MultiEdit", "Glob", "Grep", "LS", "TodoWrite"
-        ]
+    _DEFAULT_TOOLS: Tuple[str, ...] = (
+        "Read",
+        "Write",
+        "Edit",
+        "Glob",
+        "Grep",
+        "LS",
+        "WebFetch",
+        "WebSearch",
+        "TodoWrite",
+    )
+    patterns: Tuple[str, ...] = (AgentPattern.PLANNER.value,)
     
-    def generate_system_prompt(self, context: Dict[str, Any]) -> str:
-        """Generate system prompt for coder agent."""
-        technologies = context.get("technologies", [])
-        domains = context.get("domains", [])
-        project_type = context.get("project_type", "general")
-        
-        prompt = f"""You are a coder agent specialized in implementing high-quality, syntactically correct code based on specifications and requirements.
+    def __init__(self, name: str = "planner", description: str = "Strategic planner for large unknown scope projects"):
+        super().__init__(name, description)
+        self.parallelism = 1
+    
+    def generate_system_prompt_parts(self, context: Dict[str, Any]) -> Tuple[str, str]:
+        """Generate the planner prompt head and the id of its static tail."""
+        ctx = _normalize_context(context)
+        head = _cached_render(
+            _render_planner_head,
+            ctx["domains_str"],
+            ctx["complexity"],
+            ctx["project_type"],
+        )
+        return head, "planner"
+
+
+_CODER_PROMPT_HEAD = """You are a coder agent specialized in implementing high-quality, syntactically correct code based on specifications and requirements.
 
 ## Your Role
 - Implement features according to specifications
@@ -146,9 +233,11 @@ class CoderAgentTemplate(BaseAgentTemplate):
 - Optimize for performance and security
 
 ## Project Context
-- Technologies: {', '.join(technologies) if technologies else 'To be determined'}
-- Domains: {', '.join(domains) if domains else 'General'}
-- Project Type: {project_type}
+- Technologies: {technologies}
+- Domains: {domains}
+- Project Type: {project_type}"""
+
+_CODER_PROMPT_TAIL = """
 
 ## Implementation Standards
 1. **Code Quality**: Write clean, readable, and maintainable code
@@ -166,31 +255,53 @@ class CoderAgentTemplate(BaseAgentTemplate):
 - YAGNI (You Aren't Gonna Need It) to avoid over-engineering
 
 Focus on delivering working, production-ready code that meets all specified requirements."""
-        
-        return prompt
 
 
-class TesterAgentTemplate(BaseAgentTemplate):
-    """Template for tester agents."""
+@lru_cache(maxsize=_PROMPT_CACHE_SIZE)
+def _render_coder_head(technologies: str, domains: str, project_type: str) -> str:
+    """Render the context-dependent head of the coder system prompt."""
+    return _CODER_PROMPT_HEAD.format_map({
+        "technologies": technologies,
+        "domains": domains,
+        "project_type": project_type,
+    })
+
+
+class CoderAgentTemplate(BaseAgentTemplate):
+    """Template for coder agents."""
     
-    def __init__(self, name: str = "tester", description: str = "QA specialist using failing tests first approach"):
-        super().__init__(name, description)
-        self.patterns = [AgentPattern.TESTER.value]
-        self.parallelism = 2
+    __slots__ = ()
     
-    def _get_default_tools(self) -> List[str]:
-        """Get default tools for tester agent."""
-        return [
-            "Bash", "Read", "Write", "Edit", "MultiEdit", "Glob", "Grep", "LS", "TodoWrite"
-        ]
+    _DEFAULT_TOOLS: Tuple[str, ...] = (
+        "Bash",
+        "Read",
+        "Write",
+        "Edit",
+        "MultiEdit",
+        "Glob",
+        "Grep",
+        "LS",
+        "TodoWrite",
+    )
+    patterns: Tuple[str, ...] = (AgentPattern.CODER.value,)
     
-    def generate_system_prompt(self, context: Dict[str, Any]) -> str:
-        """Generate system prompt for tester agent."""
-        project_type = context.get("project_type", "general")
-        technologies = context.get("technologies", [])
-        complexity = context.get("complexity", "medium")
-        
-        prompt = f"""You are a tester agent specialized in quality assurance using a failing tests first approach (Test-Driven Development).
+    def __init__(self, name: str = "coder", description: str = "Implementation specialist for syntactically correct code"):
+        super().__init__(name, description)
+        self.parallelism = 3
+    
+    def generate_system_prompt_parts(self, context: Dict[str, Any]) -> Tuple[str, str]:
+        """Generate the coder prompt head and the id of its static tail."""
+        ctx = _normalize_context(context)
+        head = _cached_render(
+            _render_coder_head,
+            ctx["technologies_str"],
+            ctx["domains_str"],
+            ctx["project_type"],
+        )
+        return head, "coder"
+
+
+_TESTER_PROMPT_HEAD = """You are a tester agent specialized in quality assurance using a failing tests first approach (Test-Driven Development).
 
 ## Your Role
 - Write comprehensive test suites before implementation
@@ -201,8 +312,10 @@ class TesterAgentTemplate(BaseAgentTemplate):
 
 ## Project Context
 - Project Type: {project_type}
-- Technologies: {', '.join(technologies) if technologies else 'To be determined'}
-- Complexity: {complexity}
+- Technologies: {technologies}
+- Complexity: {complexity}"""
+
+_TESTER_PROMPT_TAIL = """
 
 ## Testing Approach
 1. **Test-First Development**: Write failing tests before implementation
@@ -230,30 +343,53 @@ class TesterAgentTemplate(BaseAgentTemplate):
 - Security scans must pass
 
 Focus on creating robust test suites that give confidence in code quality and catch issues early."""
-        
-        return prompt
 
 
-class ResearcherAgentTemplate(BaseAgentTemplate):
-    """Template for researcher agents."""
+@lru_cache(maxsize=_PROMPT_CACHE_SIZE)
+def _render_tester_head(project_type: str, technologies: str, complexity: str) -> str:
+    """Render the context-dependent head of the tester system prompt."""
+    return _TESTER_PROMPT_HEAD.format_map({
+        "project_type": project_type,
+        "technologies": technologies,
+        "complexity": complexity,
+    })
+
+
+class TesterAgentTemplate(BaseAgentTemplate):
+    """Template for tester agents."""
     
-    def __init__(self, name: str = "researcher", description: str = "Research specialist for external knowledge with citations"):
+    __slots__ = ()
+    
+    _DEFAULT_TOOLS: Tuple[str, ...] = (
+        "Bash",
+        "Read",
+        "Write",
+        "Edit",
+        "MultiEdit",
+        "Glob",
+        "Grep",
+        "LS",
+        "TodoWrite",
+    )
+    patterns: Tuple[str, ...] = (AgentPattern.TESTER.value,)
+    
+    def __init__(self, name: str = "tester", description: str = "QA specialist using failing tests first approach"):
         super().__init__(name, description)
-        self.patterns = [AgentPattern.RESEARCHER.value]
         self.parallelism = 2
     
-    def _get_default_tools(self) -> List[str]:
-        """Get default tools for researcher agent."""
-        return [
-            "WebSearch", "WebFetch", "Read", "Write", "Edit", "Glob", "Grep", "LS", "TodoWrite"
-        ]
-    
-    def generate_system_prompt(self, context: Dict[str, Any]) -> str:
-        """Generate system prompt for researcher agent."""
-        domains = context.get("domains", [])
-        technologies = context.get("technologies", [])
-        
-        prompt = f"""You are a researcher agent specialized in gathering external knowledge and providing well-cited, accurate information.
+    def generate_system_prompt_parts(self, context: Dict[str, Any]) -> Tuple[str, str]:
+        """Generate the tester prompt head and the id of its static tail."""
+        ctx = _normalize_context(context)
+        head = _cached_render(
+            _render_tester_head,
+            ctx["project_type"],
+            ctx["technologies_str"],
+            ctx["complexity"],
+        )
+        return head, "tester"
+
+
+_RESEARCHER_PROMPT_HEAD = """You are a researcher agent specialized in gathering external knowledge and providing well-cited, accurate information.
 
 ## Your Role
 - Research best practices and current standards
@@ -263,8 +399,10 @@ class ResearcherAgentTemplate(BaseAgentTemplate):
 - Provide properly cited sources for all information
 
 ## Project Context
-- Domains: {', '.join(domains) if domains else 'General'}
-- Technologies: {', '.join(technologies) if technologies else 'To be determined'}
+- Domains: {domains}
+- Technologies: {technologies}"""
+
+_RESEARCHER_PROMPT_TAIL = """
 
 ## Research Methodology
 1. **Source Identification**: Find authoritative and up-to-date sources
@@ -298,8 +436,121 @@ class ResearcherAgentTemplate(BaseAgentTemplate):
 - Properly formatted bibliography
 
 Always provide citations for all external information and validate accuracy before presenting findings."""
+
+
+@lru_cache(maxsize=_PROMPT_CACHE_SIZE)
+def _render_researcher_head(domains: str, technologies: str) -> str:
+    """Render the context-dependent head of the researcher system prompt."""
+    return _RESEARCHER_PROMPT_HEAD.format_map({
+        "domains": domains,
+        "technologies": technologies,
+    })
+
+
+class ResearcherAgentTemplate(BaseAgentTemplate):
+    """Template for researcher agents."""
+    
+    __slots__ = ()
+    
+    _DEFAULT_TOOLS: Tuple[str, ...] = (
+        "WebSearch",
+        "WebFetch",
+        "Read",
+        "Write",
+        "Edit",
+        "Glob",
+        "Grep",
+        "LS",
+        "TodoWrite",
+    )
+    patterns: Tuple[str, ...] = (AgentPattern.RESEARCHER.value,)
+    
+    def __init__(self, name: str = "researcher", description: str = "Research specialist for external knowledge with citations"):
+        super().__init__(name, description)
+        self.parallelism = 2
+    
+    def generate_system_prompt_parts(self, context: Dict[str, Any]) -> Tuple[str, str]:
+        """Generate the researcher prompt head and the id of its static tail."""
+        ctx = _normalize_context(context)
+        head = _cached_render(
+            _render_researcher_head,
+            ctx["domains_str"],
+            ctx["technologies_str"],
+        )
+        return head, "researcher"
+
+
+# Project types whose dynamic agents also get the tester pattern
+_TEST_PROJECT_TYPES = frozenset({"api", "library", "webapp"})
+
+# Domains whose dynamic agents also get the researcher pattern
+_RESEARCH_DOMAINS = frozenset({"ml", "blockchain"})
+
+# Rules choosing dynamic agent patterns from (complexity, domains, project type),
+# in the order the patterns are combined
+_DYNAMIC_RULES: Tuple[Tuple[Callable[[str, List[str], str], bool], AgentPattern], ...] = (
+    # Always include coder
+    (lambda complexity, domains, project_type: True, AgentPattern.CODER),
+    (
+        lambda complexity, domains, project_type: complexity == "high" or len(domains) > 2,
+        AgentPattern.PLANNER,
+    ),
+    (
+        lambda complexity, domains, project_type: project_type in _TEST_PROJECT_TYPES,
+        AgentPattern.TESTER,
+    ),
+    (
+        lambda complexity, domains, project_type: not _RESEARCH_DOMAINS.isdisjoint(domains),
+        AgentPattern.RESEARCHER,
+    ),
+)
+
+
+# Static prompt tails by id, shared by every generated prompt
+_STATIC_PROMPT_TAILS: Dict[str, str] = {
+    "planner": _PLANNER_PROMPT_TAIL,
+    "coder": _CODER_PROMPT_TAIL,
+    "tester": _TESTER_PROMPT_TAIL,
+    "researcher": _RESEARCHER_PROMPT_TAIL,
+}
+
+
+@lru_cache(maxsize=_PROMPT_CACHE_SIZE)
+def _render_pattern_sections(
+    patterns: Tuple[AgentPattern, ...],
+    domains_str: str,
+    technologies_str: str,
+    complexity: str,
+    project_type: str,
+) -> str:
+    """Render the capability sections of a custom agent combining patterns.
+    
+    Args:
+        patterns: Patterns in the order their sections appear
+        domains_str: Pre-joined domains
+        technologies_str: Pre-joined technologies
+        complexity: Project complexity
+        project_type: Project type
         
-        return prompt
+    Returns:
+        Concatenated capability sections
+    """
+    context = {
+        "domains_str": domains_str,
+        "technologies_str": technologies_str,
+        "complexity": complexity,
+        "project_type": project_type,
+    }
+    create_template = AgentTemplateFactory.create_template
+    titles = _PATTERN_TITLE
+    parts = []
+    append = parts.append
+    for pattern in patterns:
+        template = create_template(pattern)
+        append(f"\n## {titles[pattern]} Capabilities\n")
+        append(template.generate_system_prompt(context))
+        append("\n")
+    return "".join(parts)
 
 
 class AgentTemplateFactory:
@@ -312,6 +563,9 @@ class AgentTemplateFactory:
         AgentPattern.RESEARCHER: ResearcherAgentTemplate,
     }
     
+    # Shared default-named templates, one per pattern
+    _default_instances: Dict[AgentPattern, BaseAgentTemplate] = {}
+    
     @classmethod
     def create_template(
         self,
@@ -321,6 +575,9 @@ class AgentTemplateFactory:
     ) -> BaseAgentTemplate:
         """Create agent template by pattern.
         
+        Templates without a custom name or description are shared per pattern
+        and must not be mutated by callers.
+        
         Args:
             pattern: Agent pattern type
             name: Optional custom name
@@ -329,19 +586,22 @@ class AgentTemplateFactory:
         Returns:
             Agent template instance
         """
-        if pattern not in self._templates:
+        try:
+            template_class = self._templates[pattern]
+        except KeyError:
             raise ValueError(f"Unknown agent pattern: {pattern}")
         
-        template_class = self._templates[pattern]
-        
         if name and description:
             return template_class(name, description)
         elif name:
-            template = template_class()
-            template.name = name
-            return template
+            return template_class(name=name)
+        elif description:
+            return template_class(description=description)
         else:
-            return template_class()
+            template = self._default_instances.get(pattern)
+            if template is None:
+                template = self._default_instances[pattern] = template_class()
+            return template
     
     @classmethod
     def create_custom_agent(
@@ -367,37 +627,82 @@ class AgentTemplateFactory:
         if not patterns:
             raise ValueError("At least one pattern must be specified")
         
-        # Combine prompts from all patterns
-        combined_prompt = f"You are {name}: {description}\n\n"
-        combined_tools = set()
-        max_parallelism = 1
+        context = _normalize_context(context or {})
+        create_template = self.create_template
+        templates = [create_template(pattern) for pattern in patterns]
+        max_parallelism = max(1, *(template.parallelism for template in templates))
         
-        context = context or {}
-        
-        for pattern in patterns:
-            template = self.create_template(pattern)
-            pattern_prompt = template.generate_system_prompt(context)
-            combined_prompt += f"\n## {pattern.value.title()} Capabilities\n{pattern_prompt}\n"
-            combined_tools.update(template.tools)
-            max_parallelism = max(max_parallelism, template.parallelism)
+        # Combine prompts from all patterns; only the header differs between
+        # agents built from the same patterns and context
+        sections = _cached_render(
+            _render_pattern_sections,
+            tuple(patterns),
+            context["domains_str"],
+            context["technologies_str"],
+            context["complexity"],
+            context["project_type"],
+        )
         
         # Use custom tools if provided
         if tools:
-            combined_tools = set(tools)
+            combined_tools = frozenset(tools)
+        elif len(templates) == 1:
+            # A single pattern's tools need no union
+            combined_tools = templates[0].tools
+        else:
+            combined_tools = frozenset().union(*(template.tools for template in templates))
         
         return {
             "name": name,
             "description": description,
             "tools": list(combined_tools),
             "parallelism": max_parallelism,
-            "patterns": [p.value for p in patterns],
-            "content": combined_prompt,
+            "patterns": [_PATTERN_VALUE[p] for p in patterns],
+            "content": f"You are {name}: {description}\n\n{sections}",
         }
     
+    @classmethod
+    def iter_custom_agent(
+        self,
+        name: str,
+        description: str,
+        patterns: List[AgentPattern],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """Yield the content of a custom agent in chunks for streaming consumers.
+        
+        The chunks join to the ``content`` returned by create_custom_agent.
+        Static prompt tails are yielded as shared strings, never copied.
+        
+        Args:
+            name: Agent name
+            description: Agent description
+            patterns: List of patterns to combine
+            context: Context for prompt generation
+            
+        Yields:
+            Consecutive pieces of the agent content
+            
+        Raises:
+            ValueError: If no patterns or an unknown pattern is given
+        """
+        if not patterns:
+            raise ValueError("At least one pattern must be specified")
+        
+        context = _normalize_context(context or {})
+        yield f"You are {name}: {description}\n\n"
+        for pattern in patterns:
+            template = self.create_template(pattern)
+            head, tail_id = template.generate_system_prompt_parts(context)
+            yield f"\n## {_PATTERN_TITLE[pattern]} Capabilities\n"
+            yield head
+            yield _STATIC_PROMPT_TAILS[tail_id]
+            yield "\n"
+    
     @classmethod
     def get_available_patterns(self) -> List[str]:
         """Get list of available pattern names."""
-        return [pattern.value for pattern in AgentPattern]
+        return list(_PATTERN_VALUE.values())
     
     @classmethod
     def generate_dynamic_agent(
@@ -421,16 +726,10 @@ class AgentTemplateFactory:
         project_type = analysis.get("project_type", "general")
         
         # Determine patterns based on analysis
-        patterns = [AgentPattern.CODER]  # Always include coder
-        
-        if complexity == "high" or len(domains) > 2:
-            patterns.append(AgentPattern.PLANNER)
-        
-        if project_type in ["api", "library", "webapp"]:
-            patterns.append(AgentPattern.TESTER)
-        
-        if "ml" in domains or "blockchain" in domains:
-            patterns.append(AgentPattern.RESEARCHER)
+        patterns = [
+            pattern for applies, pattern in _DYNAMIC_RULES
+            if applies(complexity, domains, project_type)
+        ]
         
         # Generate name and description
         domain_str = "-".join(domains[:2]) if domains else "general"
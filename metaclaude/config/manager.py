@@ -1,18 +1,68 @@
 """Configuration manager for MetaClaude."""
 
 import os
+import copy
 import json
-import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 from pydantic import ValidationError
 
-from .models import MetaClaudeConfig, ConfigDefaults
+from .models import MetaClaudeConfig, ConfigDefaults, _copy_dicts, _deep_merge_inplace
 from ..utils.errors import MetaClaudeConfigError
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Parsed config files: resolved path -> (st_mtime_ns, st_size, parsed dict)
+_FILE_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+# Environment variables read by ConfigManager._load_from_environment
+_ENV_PREFIX = "METACLAUDE_"
+_ENV_PREFIX_LEN = len(_ENV_PREFIX)
+_ENV_KEY_TABLE = str.maketrans("_", ".")
+
+# Characters that can appear in a float written in plain decimal or exponent form
+_FLOAT_START_CHARS = frozenset("0123456789+-.")
+_FLOAT_CHARS = frozenset("0123456789+-.eE")
+
+# Config file names searched by find_config_file, in order of precedence
+_CONFIG_NAMES = (
+    "metaclaude.yaml", "metaclaude.yml", "metaclaude.json",
+    ".metaclaude.yaml", ".metaclaude.yml", ".metaclaude.json",
+)
+
+
+def _load_yaml(content: str) -> Any:
+    """Parse YAML text, importing PyYAML only when a YAML file is actually read.
+    
+    Args:
+        content: YAML document
+        
+    Returns:
+        Parsed document
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without LibYAML
+        from yaml import SafeLoader
+    return yaml.load(content, Loader=SafeLoader)
+
+
+def _dump_yaml(data: Dict[str, Any], stream: Any) -> None:
+    """Write plain data as block-style YAML, importing PyYAML on demand.
+    
+    Args:
+        data: Data made of plain (JSON-compatible) types
+        stream: Writable text stream
+    """
+    import yaml
+    try:
+        from yaml import CSafeDumper as SafeDumper
+    except ImportError:  # PyYAML built without LibYAML
+        from yaml import SafeDumper
+    yaml.dump(data, stream, Dumper=SafeDumper, default_flow_style=False)
+
 
 class ConfigManager:
     """Manages MetaClaude configuration from multiple sources."""
@@ -26,6 +76,7 @@ class ConfigManager:
         self.config_file = config_file
         self.config: Optional[MetaClaudeConfig] = None
         self._config_sources = []
+        self._summary: Optional[Dict[str, Any]] = None
         
         logger.info("ConfigManager initialized")
     
@@ -46,7 +97,8 @@ class ConfigManager:
         Args:
             config_file: Optional configuration file path
             cli_overrides: CLI argument overrides
-            validate: Whether to validate configuration
+            validate: Whether to also check filesystem preconditions such as the
+                Docker build context (the model itself is always validated)
             
         Returns:
             Loaded MetaClaude configuration
@@ -56,26 +108,28 @@ class ConfigManager:
         """
         try:
             logger.info("Loading MetaClaude configuration")
+            self._summary = None
             
-            # Start with defaults
+            # Start with defaults (a fresh dict, merged into in place below)
             config_dict = ConfigDefaults.get_default_config()
             self._config_sources.append("defaults")
             
             # Load from environment variables
             env_config = self._load_from_environment()
             if env_config:
-                config_dict = self._deep_merge(config_dict, env_config)
+                _deep_merge_inplace(config_dict, env_config)
                 self._config_sources.append("environment")
             
             # Load from configuration file
             file_config = self._load_from_file(config_file or self.config_file)
             if file_config:
-                config_dict = self._deep_merge(config_dict, file_config)
+                _deep_merge_inplace(config_dict, file_config)
                 self._config_sources.append(f"file:{config_file or self.config_file}")
             
             # Apply CLI overrides
             if cli_overrides:
-                config_dict = self._deep_merge(config_dict, cli_overrides)
+                # Copied so later merges never write into the caller's dicts
+                _deep_merge_inplace(config_dict, _copy_dicts(cli_overrides))
                 self._config_sources.append("cli")
             
             # Add templates directory if not specified
@@ -83,12 +137,15 @@ class ConfigManager:
                 templates_dir = Path(__file__).parent.parent.parent / "templates"
                 config_dict["templates"] = {"templates_dir": templates_dir}
             
-            # Create and validate configuration
+            # Create and validate configuration (nested sections need validation
+            # to become models, so both modes go through model_validate)
+            config = MetaClaudeConfig.model_validate(config_dict)
             if validate:
-                self.config = MetaClaudeConfig(**config_dict)
-            else:
-                # Skip validation for partial configs
-                self.config = MetaClaudeConfig.parse_obj(config_dict)
+                self._check_runtime_preconditions(config)
+            
+            # Validation stays free of side effects; create the output directory here, once
+            config.execution.output_base_dir.mkdir(parents=True, exist_ok=True)
+            self.config = config
             
             logger.info(f"Configuration loaded from sources: {', '.join(self._config_sources)}")
             return self.config
@@ -109,32 +166,55 @@ class ConfigManager:
         Returns:
             Configuration dictionary or None
         """
-        if not config_file or not config_file.exists():
+        if not config_file:
             return None
         
+        try:
+            stat = config_file.stat()
+        except OSError:
+            return None
+        
+        cache_key = str(config_file.resolve())
+        cached = _FILE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            logger.debug(f"Using cached configuration file: {config_file}")
+            # Copy so callers can merge into the result without touching the cache
+            return copy.deepcopy(cached[2])
+        
         try:
             logger.debug(f"Loading configuration from file: {config_file}")
             
             content = config_file.read_text(encoding="utf-8")
             
-            if config_file.suffix.lower() in [".yaml", ".yml"]:
-                config_dict = yaml.safe_load(content)
-            elif config_file.suffix.lower() == ".json":
+            suffix = config_file.suffix.lower()
+            if suffix == ".json":
                 config_dict = json.loads(content)
+            elif suffix in (".yaml", ".yml"):
+                config_dict = _load_yaml(content)
             else:
-                # Try to detect format from content
+                # Detect format from content; JSON first since it needs no PyYAML
                 try:
-                    config_dict = yaml.safe_load(content)
-                except yaml.YAMLError:
                     config_dict = json.loads(content)
+                except json.JSONDecodeError:
+                    config_dict = _load_yaml(content)
             
             logger.debug(f"Loaded configuration from file: {len(config_dict)} keys")
+            _FILE_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(config_dict))
             return config_dict
             
         except Exception as e:
             logger.warning(f"Failed to load configuration file {config_file}: {e}")
             return None
     
+    @classmethod
+    def clear_file_cache(cls) -> None:
+        """Forget all parsed configuration files.
+        
+        Files are re-read automatically when their mtime or size changes;
+        this is only needed to force a re-read regardless.
+        """
+        _FILE_CACHE.clear()
+    
     def _load_from_environment(self) -> Dict[str, Any]:
         """Load configuration from environment variables.
         
@@ -147,20 +227,23 @@ class ConfigManager:
         """
         config_dict = {}
         
-        for key, value in os.environ.items():
-            if not key.startswith("METACLAUDE_"):
-                continue
-            
+        # Filter first so only our few variables reach the Python-level work below
+        env_items = [
+            (key, value) for key, value in os.environ.items() if key.startswith(_ENV_PREFIX)
+        ]
+        
+        for key, value in env_items:
             # Convert METACLAUDE_DOCKER_IMAGE_NAME to docker.image_name
-            config_key = key[11:].lower().replace("_", ".")
-            
-            # Parse value
-            parsed_value = self._parse_env_value(value)
+            config_key = key[_ENV_PREFIX_LEN:].lower().translate(_ENV_KEY_TABLE)
             
-            # Set nested value
-            self._set_nested_value(config_dict, config_key, parsed_value)
-        
-        if config_dict:
+            # Walk/create the nested sections, then set the leaf
+            *sections, leaf = config_key.split(".")
+            current = config_dict
+            for section in sections:
+                current = current.setdefault(section, {})
+            current[leaf] = self._parse_env_value(value)
+        
+        if env_items:
             logger.debug(f"Loaded configuration from environment: {len(config_dict)} keys")
         
         return config_dict
@@ -174,19 +257,22 @@ class ConfigManager:
         Returns:
             Parsed value
         """
-        # Boolean values
-        if value.lower() in ("true", "false"):
-            return value.lower() == "true"
+        # Boolean values; only short strings can match, so skip lower() otherwise
+        if len(value) <= 5:
+            lowered = value.lower()
+            if lowered in ("true", "false"):
+                return lowered == "true"
         
         # Integer values
         if value.isdigit():
             return int(value)
         
-        # Float values
-        try:
-            return float(value)
-        except ValueError:
-            pass
+        # Float values; only attempt (and risk a ValueError) when the text could be a number
+        if value[:1] in _FLOAT_START_CHARS and _FLOAT_CHARS.issuperset(value):
+            try:
+                return float(value)
+            except ValueError:
+                pass
         
         # JSON values (for complex types)
         if value.startswith(("[", "{")):
@@ -198,44 +284,6 @@ class ConfigManager:
         # String value
         return value
     
-    def _set_nested_value(self, config_dict: Dict[str, Any], key: str, value: Any) -> None:
-        """Set nested dictionary value using dot notation.
-        
-        Args:
-            config_dict: Target dictionary
-            key: Dot-notation key (e.g., 'docker.image_name')
-            value: Value to set
-        """
-        keys = key.split(".")
-        current = config_dict
-        
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
-        
-        current[keys[-1]] = value
-    
-    def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two dictionaries.
-        
-        Args:
-            base: Base dictionary
-            override: Override dictionary
-            
-        Returns:
-            Merged dictionary
-        """
-        result = base.copy()
-        
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-        
-        return result
-    
     def save_config(self, config_file: Path, format_type: str = "yaml") -> None:
         """Save current configuration to file.
         
@@ -252,8 +300,8 @@ class ConfigManager:
         try:
             logger.info(f"Saving configuration to {config_file}")
             
-            # Convert to dictionary
-            config_dict = self.config.dict()
+            # Convert to plain JSON types (paths become strings)
+            config_dict = self.config.model_dump(mode="json")
             
             # Create directory if needed
             config_file.parent.mkdir(parents=True, exist_ok=True)
@@ -261,10 +309,10 @@ class ConfigManager:
             # Write file
             if format_type.lower() == "json":
                 with open(config_file, "w", encoding="utf-8") as f:
-                    json.dump(config_dict, f, indent=2, default=str)
+                    json.dump(config_dict, f, indent=2)
             else:  # yaml
                 with open(config_file, "w", encoding="utf-8") as f:
-                    yaml.dump(config_dict, f, default_flow_style=False, default=str)
+                    _dump_yaml(config_dict, f)
             
             logger.info(f"Configuration saved to {config_file}")
             
@@ -285,6 +333,24 @@ class ConfigManager:
             raise MetaClaudeConfigError("No configuration loaded. Call load_config() first.")
         return self.config
     
+    def validate_runtime_preconditions(self) -> None:
+        """Check filesystem preconditions for running Docker with this configuration.
+        
+        Run by load_config unless it is called with ``validate=False``; kept out
+        of the model validators so validate_config() has no filesystem checks.
+        
+        Raises:
+            MetaClaudeConfigError: If no configuration is loaded or a configured path is missing
+        """
+        self._check_runtime_preconditions(self.get_config())
+    
+    @staticmethod
+    def _check_runtime_preconditions(config: MetaClaudeConfig) -> None:
+        """Raise MetaClaudeConfigError if a path the configuration needs is missing."""
+        build_context = config.docker.build_context
+        if build_context and not build_context.exists():
+            raise MetaClaudeConfigError(f"Docker build context does not exist: {build_context}")
+    
     def validate_config(self, config_dict: Optional[Dict[str, Any]] = None) -> List[str]:
         """Validate configuration dictionary.
         
@@ -295,15 +361,14 @@ class ConfigManager:
             List of validation errors (empty if valid)
         """
         if config_dict is None:
-            if not self.config:
-                return ["No configuration loaded"]
-            config_dict = self.config.dict()
+            # The loaded configuration was validated when it was built
+            return [] if self.config else ["No configuration loaded"]
         
         errors = []
         
         try:
             # Attempt to create MetaClaudeConfig instance
-            MetaClaudeConfig(**config_dict)
+            MetaClaudeConfig.model_validate(config_dict)
         except ValidationError as e:
             for error in e.errors():
                 field = ".".join(str(x) for x in error["loc"])
@@ -323,19 +388,24 @@ class ConfigManager:
         if not self.config:
             return {"status": "No configuration loaded"}
         
-        return {
-            "status": "Loaded",
-            "sources": self._config_sources,
-            "docker_image": self.config.get_full_docker_image_name(),
-            "claude_model": self.config.claude.model,
-            "timeout": f"{self.config.execution.timeout}s",
-            "log_level": self.config.logging.level,
-            "debug_mode": self.config.is_debug_enabled(),
-            "agents_count": len(self.config.agents),
-            "enabled_agents": len(self.config.get_enabled_agents()),
-            "templates_dir": str(self.config.templates.templates_dir),
-            "output_dir": str(self.config.execution.output_base_dir),
-        }
+        # Built once per load_config; callers get their own shallow copy
+        if self._summary is None:
+            config = self.config
+            self._summary = {
+                "status": "Loaded",
+                "sources": list(self._config_sources),
+                "docker_image": config.get_full_docker_image_name(),
+                "claude_model": config.claude.model,
+                "timeout": f"{config.execution.timeout}s",
+                "log_level": config.logging.level,
+                "debug_mode": config.is_debug_enabled(),
+                "agents_count": len(config.agents),
+                "enabled_agents": sum(1 for agent in config.agents.values() if agent.enabled),
+                "templates_dir": str(config.templates.templates_dir),
+                "output_dir": str(config.execution.output_base_dir),
+            }
+        
+        return dict(self._summary)
     
     def create_cli_overrides(
         self,
@@ -411,19 +481,19 @@ class ConfigManager:
         """
         start_dir = start_dir or Path.cwd()
         
-        config_names = [
-            "metaclaude.yaml", "metaclaude.yml", "metaclaude.json",
-            ".metaclaude.yaml", ".metaclaude.yml", ".metaclaude.json"
-        ]
-        
-        # Search up the directory tree
+        # Search up the directory tree, listing each directory once
         current_dir = start_dir.resolve()
         
         while True:
-            for config_name in config_names:
-                config_file = current_dir / config_name
-                if config_file.exists():
-                    return config_file
+            try:
+                with os.scandir(current_dir) as entries:
+                    file_names = {entry.name for entry in entries if entry.is_file()}
+            except OSError:  # Unreadable or missing directory; keep climbing
+                file_names = ()
+            
+            for config_name in _CONFIG_NAMES:
+                if config_name in file_names:
+                    return current_dir / config_name
             
             # Move to parent directory
             parent = current_dir.parent
@@ -2,10 +2,16 @@
 
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
-class DockerConfig(BaseModel):
+class _DeferredModel(BaseModel):
+    """Base for config models; core schemas are built on first validation, not at import."""
+    
+    model_config = ConfigDict(defer_build=True)
+
+
+class DockerConfig(_DeferredModel):
     """Docker configuration model."""
     
     image_name: str = Field(default="metaclaude", description="Docker image name")
@@ -14,7 +20,8 @@ class DockerConfig(BaseModel):
     dockerfile_path: Optional[Path] = Field(default=None, description="Path to Dockerfile")
     no_cache: bool = Field(default=False, description="Disable Docker build cache")
     
-    @validator("build_context", "dockerfile_path", pre=True)
+    @field_validator("build_context", "dockerfile_path", mode="before")
+    @classmethod
     def convert_path(cls, v):
         """Convert string paths to Path objects."""
         if v is not None and not isinstance(v, Path):
@@ -22,7 +29,7 @@ class DockerConfig(BaseModel):
         return v
 
 
-class AgentConfig(BaseModel):
+class AgentConfig(_DeferredModel):
     """Agent configuration model."""
     
     name: str = Field(..., description="Agent name")
@@ -32,7 +39,8 @@ class AgentConfig(BaseModel):
     patterns: List[str] = Field(default_factory=list, description="Agent patterns")
     enabled: bool = Field(default=True, description="Whether agent is enabled")
     
-    @validator("parallelism")
+    @field_validator("parallelism")
+    @classmethod
     def validate_parallelism(cls, v):
         """Validate parallelism range."""
         if v < 1 or v > 10:
@@ -40,7 +48,7 @@ class AgentConfig(BaseModel):
         return v
 
 
-class TemplateConfig(BaseModel):
+class TemplateConfig(_DeferredModel):
     """Template system configuration model."""
     
     templates_dir: Path = Field(..., description="Templates directory path")
@@ -48,14 +56,16 @@ class TemplateConfig(BaseModel):
     strict_mode: bool = Field(default=True, description="Strict template validation")
     custom_variables: Dict[str, Any] = Field(default_factory=dict, description="Custom template variables")
     
-    @validator("templates_dir", pre=True)
+    @field_validator("templates_dir", mode="before")
+    @classmethod
     def convert_templates_dir(cls, v):
         """Convert string path to Path object."""
         if not isinstance(v, Path):
             return Path(v)
         return v
     
-    @validator("templates_dir")
+    @field_validator("templates_dir")
+    @classmethod
     def validate_templates_dir(cls, v):
         """Validate templates directory exists."""
         if not v.exists():
@@ -63,7 +73,7 @@ class TemplateConfig(BaseModel):
         return v
 
 
-class ExecutionConfig(BaseModel):
+class ExecutionConfig(_DeferredModel):
     """Execution configuration model."""
     
     timeout: int = Field(default=14400, description="Execution timeout in seconds")  # 4 hours
@@ -71,21 +81,24 @@ class ExecutionConfig(BaseModel):
     keep_container: bool = Field(default=False, description="Keep container after execution")
     output_base_dir: Path = Field(default=Path.cwd(), description="Base output directory")
     
-    @validator("timeout")
+    @field_validator("timeout")
+    @classmethod
     def validate_timeout(cls, v):
         """Validate timeout range."""
         if v < 60 or v > 86400:  # 1 minute to 24 hours
             raise ValueError("Timeout must be between 60 and 86400 seconds")
         return v
     
-    @validator("max_retries")
+    @field_validator("max_retries")
+    @classmethod
     def validate_retries(cls, v):
         """Validate retry count."""
         if v < 0 or v > 10:
             raise ValueError("Max retries must be between 0 and 10")
         return v
     
-    @validator("output_base_dir", pre=True)
+    @field_validator("output_base_dir", mode="before")
+    @classmethod
     def convert_output_dir(cls, v):
         """Convert string path to Path object."""
         if not isinstance(v, Path):
@@ -93,7 +106,7 @@ class ExecutionConfig(BaseModel):
         return v
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_DeferredModel):
     """Logging configuration model."""
     
     level: str = Field(default="INFO", description="Logging level")
@@ -103,7 +116,8 @@ class LoggingConfig(BaseModel):
     max_file_size: int = Field(default=10485760, description="Max log file size in bytes")  # 10MB
     backup_count: int = Field(default=5, description="Number of backup log files")
     
-    @validator("level")
+    @field_validator("level")
+    @classmethod
     def validate_level(cls, v):
         """Validate logging level."""
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -111,7 +125,8 @@ class LoggingConfig(BaseModel):
             raise ValueError(f"Invalid logging level. Must be one of: {valid_levels}")
         return v.upper()
     
-    @validator("log_file", pre=True)
+    @field_validator("log_file", mode="before")
+    @classmethod
     def convert_log_file(cls, v):
         """Convert string path to Path object."""
         if v is not None and not isinstance(v, Path):
@@ -119,7 +134,7 @@ class LoggingConfig(BaseModel):
         return v
 
 
-class ClaudeConfig(BaseModel):
+class ClaudeConfig(_DeferredModel):
     """Claude-specific configuration model."""
     
     model: str = Field(default="opus", description="Claude model to use")
@@ -127,7 +142,8 @@ class ClaudeConfig(BaseModel):
     auto_compact: bool = Field(default=False, description="Enable auto-compact")
     temperature: Optional[float] = Field(default=None, description="Model temperature")
     
-    @validator("model")
+    @field_validator("model")
+    @classmethod
     def validate_model(cls, v):
         """Validate Claude model name."""
         valid_models = [
@@ -140,14 +156,16 @@ class ClaudeConfig(BaseModel):
             raise ValueError(f"Invalid model. Must be one of: {valid_models}")
         return v
     
-    @validator("max_thinking_tokens")
+    @field_validator("max_thinking_tokens")
+    @classmethod
     def validate_thinking_tokens(cls, v):
         """Validate thinking tokens range."""
         if v < 1000 or v > 100000:
             raise ValueError("Max thinking tokens must be between 1000 and 100000")
         return v
     
-    @validator("temperature")
+    @field_validator("temperature")
+    @classmethod
     def validate_temperature(cls, v):
         """Validate temperature range."""
         if v is not None and (v < 0.0 or v > 1.0):
@@ -155,14 +173,15 @@ class ClaudeConfig(BaseModel):
         return v
 
 
-class MCPConfig(BaseModel):
+class MCPConfig(_DeferredModel):
     """MCP (Model Context Protocol) configuration model."""
     
     enabled: bool = Field(default=True, description="Enable MCP integration")
     servers: Dict[str, Dict[str, Any]] = Field(default_factory=dict, description="MCP server configurations")
     timeout: int = Field(default=30, description="MCP operation timeout")
     
-    @validator("timeout")
+    @field_validator("timeout")
+    @classmethod
     def validate_timeout(cls, v):
         """Validate MCP timeout."""
         if v < 5 or v > 300:
@@ -170,7 +189,7 @@ class MCPConfig(BaseModel):
         return v
 
 
-class MetaClaudeConfig(BaseModel):
+class MetaClaudeConfig(_DeferredModel):
     """Main MetaClaude configuration model."""
     
     # Core configuration sections
@@ -188,30 +207,7 @@ class MetaClaudeConfig(BaseModel):
     version: str = Field(default="0.1.0", description="MetaClaude version")
     debug: bool = Field(default=False, description="Enable debug mode")
     
-    class Config:
-        """Pydantic configuration."""
-        validate_assignment = True
-        use_enum_values = True
-        arbitrary_types_allowed = True
-    
-    @root_validator
-    def validate_config_consistency(cls, values):
-        """Validate configuration consistency."""
-        # Ensure Docker build context exists if specified
-        docker_config = values.get("docker")
-        if docker_config and docker_config.build_context:
-            if not docker_config.build_context.exists():
-                raise ValueError(f"Docker build context does not exist: {docker_config.build_context}")
-        
-        # Ensure output directory is writable
-        execution_config = values.get("execution")
-        if execution_config:
-            try:
-                execution_config.output_base_dir.mkdir(parents=True, exist_ok=True)
-            except (OSError, PermissionError) as e:
-                raise ValueError(f"Cannot create output directory: {e}")
-        
-        return values
+    model_config = ConfigDict(use_enum_values=True, arbitrary_types_allowed=True)
     
     def get_full_docker_image_name(self) -> str:
         """Get full Docker image name with tag."""
@@ -234,58 +230,101 @@ class MetaClaudeConfig(BaseModel):
         return {name: config for name, config in self.agents.items() if config.enabled}
 
 
+# Built once; ConfigDefaults hands out copies so callers may mutate them
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "docker": {
+        "image_name": "metaclaude",
+        "image_tag": "latest",
+        "no_cache": False,
+    },
+    "execution": {
+        "timeout": 14400,  # 4 hours
+        "max_retries": 3,
+        "keep_container": False,
+    },
+    "logging": {
+        "level": "INFO",
+        "console_output": True,
+        "structured_logging": False,
+    },
+    "claude": {
+        "model": "opus",
+        "max_thinking_tokens": 32000,
+        "auto_compact": False,
+    },
+    "mcp": {
+        "enabled": True,
+        "timeout": 30,
+        "servers": {},
+    },
+    "debug": False,
+}
+
+# Development settings, merged over the defaults
+_DEVELOPMENT_OVERRIDES: Dict[str, Any] = {
+    "debug": True,
+    "logging": {
+        "level": "DEBUG",
+        "console_output": True,
+        "structured_logging": True,
+    },
+    "execution": {
+        "timeout": 1800,  # 30 minutes for development
+        "keep_container": True,
+    },
+    "docker": {
+        "no_cache": True,
+    },
+}
+
+
+def _copy_dicts(tree: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy every nested dict of a config tree, sharing the (immutable) leaves.
+    
+    Args:
+        tree: Configuration dictionary
+        
+    Returns:
+        Copy that can be merged into without affecting the original
+    """
+    return {
+        key: _copy_dicts(value) if value.__class__ is dict else value
+        for key, value in tree.items()
+    }
+
+
+def _deep_merge_inplace(target: Dict[str, Any], override: Dict[str, Any]) -> None:
+    """Deep merge override into target, modifying target in place.
+    
+    Only branches present in override are visited. Values from override
+    are stored by reference, so callers pass overrides they own.
+    
+    Args:
+        target: Dictionary to merge into
+        override: Override dictionary
+    """
+    if not override:
+        return
+    
+    for key, value in override.items():
+        current = target.get(key)
+        if value.__class__ is dict and current.__class__ is dict:
+            _deep_merge_inplace(current, value)
+        else:
+            target[key] = value
+
+
 class ConfigDefaults:
     """Default configuration values."""
     
     @staticmethod
     def get_default_config() -> Dict[str, Any]:
         """Get default configuration dictionary."""
-        return {
-            "docker": {
-                "image_name": "metaclaude",
-                "image_tag": "latest",
-                "no_cache": False,
-            },
-            "execution": {
-                "timeout": 14400,  # 4 hours
-                "max_retries": 3,
-                "keep_container": False,
-            },
-            "logging": {
-                "level": "INFO",
-                "console_output": True,
-                "structured_logging": False,
-            },
-            "claude": {
-                "model": "opus",
-                "max_thinking_tokens": 32000,
-                "auto_compact": False,
-            },
-            "mcp": {
-                "enabled": True,
-                "timeout": 30,
-                "servers": {},
-            },
-            "debug": False,
-        }
+        return _copy_dicts(_DEFAULT_CONFIG)
     
     @staticmethod
     def get_development_config() -> Dict[str, Any]:
         """Get development-specific configuration."""
-        config = ConfigDefaults.get_default_config()
-        config.update({
-            "debug": True,
-            "logging": {
-                "level": "DEBUG",
-                "console_output": True,
-                "structured_logging": True,
-            },
-            "execution": {
-                "timeout": 1800,  # 30 minutes for development
-                "keep_container": True,
-            },
-            "docker": {
-                "no_cache": True,
-            },
-        })
-        return config
\ No newline at end of file
+        config = _copy_dicts(_DEFAULT_CONFIG)
+        _deep_merge_inplace(config, _copy_dicts(_DEVELOPMENT_OVERRIDES))
+        return config
@@ -2,6 +2,7 @@
 
 import time
 import signal
+import logging
 import asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -9,6 +10,7 @@ from typing import Dict, Any, Optional, List, Tuple
 from contextlib import contextmanager
 
 from ..docker.manager import DockerManager
+from ..templates.constants import AGENTS_SUBDIR
 from ..templates.manager import TemplateManager
 from ..agents.selector import AgentSelector
 from ..agents.claude_agentic_integration import ClaudeAgenticIntegration
@@ -46,7 +48,7 @@ class MetaClaudeOrchestrator:
         # Initialize components
         self.docker_manager = DockerManager(docker_image, docker_tag)
         self.template_manager = TemplateManager(templates_dir)
-        self.agent_selector = AgentSelector(templates_dir / ".claude" / "agents")
+        self.agent_selector = AgentSelector(templates_dir / AGENTS_SUBDIR)
         self.idea_analyzer = IdeaAnalyzer()
         
         # Initialize agentic integration if enabled
@@ -823,6 +825,7 @@ ls -la /workspace/output/
         log_execution_start("execution monitoring")
         
         start_time = time.time()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         try:
             # Monitor logs in real-time
@@ -834,7 +837,8 @@ ls -la /workspace/output/
                     raise VCCTimeoutError(f"Execution timed out after {timeout} seconds")
                 
                 # Log progress
-                logger.debug(f"[Container] {log_line}")
+                if debug_enabled:
+                    logger.debug(f"[Container] {log_line}")
                 
                 # Check for completion indicators
                 if self._is_execution_complete(log_line):
@@ -1,5 +1,6 @@
 """Docker management module for MetaClaude runtime environment."""
 
+import logging
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional, Generator
@@ -189,6 +190,43 @@ class DockerManager:
             logger.error(f"Failed to copy files to container: {e}")
             raise MetaClaudeDockerError(f"File copy failed: {e}")
     
+    def write_file_to_container(
+        self, container: Container, data: bytes, dest_dir: str, filename: str
+    ) -> str:
+        """Write in-memory data to a file inside the container.
+        
+        Args:
+            container: Target container
+            data: File contents
+            dest_dir: Destination directory in container
+            filename: Name of the file to create
+            
+        Returns:
+            Path of the written file inside the container
+            
+        Raises:
+            MetaClaudeDockerError: If copy operation fails
+        """
+        try:
+            import tarfile
+            import io
+            
+            tar_stream = io.BytesIO()
+            with tarfile.open(fileobj=tar_stream, mode="w") as tar:
+                info = tarfile.TarInfo(name=filename)
+                info.size = len(data)
+                info.mtime = int(time.time())
+                tar.addfile(info, io.BytesIO(data))
+            
+            container.put_archive(dest_dir, tar_stream.getvalue())
+            dest_path = f"{dest_dir.rstrip('/')}/{filename}"
+            logger.info(f"Wrote {len(data)} bytes to container:{dest_path}")
+            return dest_path
+            
+        except Exception as e:
+            logger.error(f"Failed to write file to container: {e}")
+            raise MetaClaudeDockerError(f"File copy failed: {e}")
+    
     def execute_command(
         self,
         container: Container,
@@ -228,6 +266,65 @@ class DockerManager:
             logger.error(f"Command execution failed: {e}")
             raise MetaClaudeDockerError(f"Command execution failed: {e}")
     
+    def execute_shell(
+        self,
+        container: Container,
+        script: str,
+        workdir: str = "/workspace",
+        stderr_tail_bytes: int = 64 * 1024,
+    ) -> tuple[int, bytes, str]:
+        """Execute a shell script in running container, keeping stdout and stderr apart.
+        
+        Output is streamed from the daemon as it is produced. Stdout is kept in
+        full, while stderr chunks are logged at debug level and only the last
+        ``stderr_tail_bytes`` are retained.
+        
+        Args:
+            container: Target container
+            script: Shell script passed to ``sh -c``
+            workdir: Working directory for command
+            stderr_tail_bytes: Maximum number of trailing stderr bytes to return
+            
+        Returns:
+            Tuple of (exit_code, raw stdout bytes, decoded stderr tail)
+            
+        Raises:
+            MetaClaudeDockerError: If command execution fails
+        """
+        try:
+            logger.info(f"Executing shell script in container: {script}")
+            
+            api = self.client.api
+            exec_id = api.exec_create(
+                container.id,
+                ["sh", "-c", script],
+                stdout=True,
+                stderr=True,
+                workdir=workdir,
+                user="metaclaude",
+            )["Id"]
+            
+            stdout = bytearray()
+            stderr_tail = bytearray()
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            for out_chunk, err_chunk in api.exec_start(exec_id, stream=True, demux=True):
+                if out_chunk:
+                    stdout += out_chunk
+                if err_chunk:
+                    if debug_enabled:
+                        logger.debug(err_chunk.decode("utf-8", errors="replace").rstrip())
+                    stderr_tail += err_chunk
+                    del stderr_tail[:-stderr_tail_bytes]
+            
+            exit_code = api.exec_inspect(exec_id)["ExitCode"]
+            logger.info(f"Shell script completed with exit code: {exit_code}")
+            
+            return exit_code, bytes(stdout), stderr_tail.decode("utf-8", errors="replace")
+            
+        except Exception as e:
+            logger.error(f"Shell script execution failed: {e}")
+            raise MetaClaudeDockerError(f"Command execution failed: {e}")
+    
     def monitor_logs(self, container: Container) -> Generator[str, None, None]:
         """Monitor container logs in real-time.
         
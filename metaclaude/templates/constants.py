@@ -0,0 +1,13 @@
+"""Template layout constants for MetaClaude.
+
+Pure data only, so the CLI can import it without pulling in Jinja2, PyYAML or
+pydantic through the template manager and agent parser.
+"""
+
+from pathlib import PurePath
+
+# Claude Code configuration directory inside the templates and generated projects
+CLAUDE_DIR_NAME = ".claude"
+
+# Agent definitions, relative to the templates directory
+AGENTS_SUBDIR = PurePath(CLAUDE_DIR_NAME, "agents")
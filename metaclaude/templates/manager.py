@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from jinja2 import Environment, FileSystemLoader, Template
 
+from .constants import CLAUDE_DIR_NAME
 from ..utils.errors import MetaClaudeTemplateError
 from ..utils.logging import get_logger
 
@@ -23,7 +24,7 @@ class TemplateManager:
             templates_dir: Path to templates directory
         """
         self.templates_dir = templates_dir
-        self.claude_dir = templates_dir / ".claude"
+        self.claude_dir = templates_dir / CLAUDE_DIR_NAME
         self.agents_dir = self.claude_dir / "agents"
         
         # Initialize Jinja2 environment
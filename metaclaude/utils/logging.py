@@ -19,24 +19,31 @@ LOG_LEVELS = {
 }
 
 # Global logger configuration
-_loggers = {}
 _log_file: Optional[Path] = None
 _log_level = logging.INFO
 
+# (level, log_file, stderr) last applied by setup_logging, so repeat calls are no-ops
+_configured: Optional[tuple] = None
+
 
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[Path] = None,
     verbose: bool = False,
+    stderr: bool = False,
 ) -> None:
     """Set up logging configuration.
     
+    Calling again with the same effective level and log file leaves the
+    existing handlers in place.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file
         verbose: Enable verbose logging
+        stderr: Send console log output to stderr, keeping stdout for data
     """
-    global _log_level, _log_file
+    global _log_level, _log_file, _configured
     
     _log_level = LOG_LEVELS.get(level.upper(), logging.INFO)
     _log_file = log_file
@@ -44,6 +51,10 @@ def setup_logging(
     if verbose:
         _log_level = logging.DEBUG
     
+    if _configured == (_log_level, log_file, stderr):
+        return
+    _configured = (_log_level, log_file, stderr)
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(_log_level)
@@ -53,7 +64,7 @@ def setup_logging(
     
     # Add rich console handler
     console_handler = RichHandler(
-        console=console,
+        console=Console(stderr=True) if stderr else console,
         show_time=True,
         show_path=True,
         markup=True,
@@ -91,12 +102,8 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    if name not in _loggers:
-        logger = logging.getLogger(name)
-        logger.setLevel(_log_level)
-        _loggers[name] = logger
-    
-    return _loggers[name]
+    # Level comes from the root logger configured by setup_logging
+    return logging.getLogger(name)
 
 
 def log_execution_start(operation: str, details: dict = None) -> None:
@@ -107,6 +114,8 @@ def log_execution_start(operation: str, details: dict = None) -> None:
         details: Optional operation details
     """
     logger = get_logger("metaclaude.execution")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     details_str = f" ({details})" if details else ""
     logger.info(f"🚀 Starting {operation}{details_str}")
 
@@ -120,6 +129,8 @@ def log_execution_complete(operation: str, duration: float = None, details: dict
         details: Optional operation details
     """
     logger = get_logger("metaclaude.execution")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     duration_str = f" in {duration:.2f}s" if duration else ""
     details_str = f" ({details})" if details else ""
     logger.info(f"✅ Completed {operation}{duration_str}{details_str}")
@@ -134,6 +145,8 @@ def log_execution_error(operation: str, error: Exception, details: dict = None)
         details: Optional operation details
     """
     logger = get_logger("metaclaude.execution")
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     details_str = f" ({details})" if details else ""
     logger.error(f"❌ Failed {operation}{details_str}: {error}")
 
@@ -147,6 +160,8 @@ def log_docker_event(event: str, container_id: str = None, details: dict = None)
         details: Optional event details
     """
     logger = get_logger("metaclaude.docker")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     container_str = f" [{container_id[:12]}]" if container_id else ""
     details_str = f" - {details}" if details else ""
     logger.info(f"🐳 {event}{container_str}{details_str}")
@@ -161,6 +176,8 @@ def log_agent_event(agent_name: str, event: str, details: dict = None) -> None:
         details: Optional event details
     """
     logger = get_logger("metaclaude.agents")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     details_str = f" - {details}" if details else ""
     logger.info(f"🤖 [{agent_name}] {event}{details_str}")
 
@@ -174,6 +191,8 @@ def log_template_event(template_name: str, event: str, details: dict = None) ->
         details: Optional event details
     """
     logger = get_logger("metaclaude.templates")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     details_str = f" - {details}" if details else ""
     logger.info(f"📋 [{template_name}] {event}{details_str}")
 
@@ -187,6 +206,8 @@ def log_cost_info(tokens_used: int, estimated_cost: float, model: str) -> None:
         model: Model name
     """
     logger = get_logger("metaclaude.cost")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(f"💰 {model}: {tokens_used:,} tokens, ~${estimated_cost:.4f}")
 
 
@@ -199,6 +220,8 @@ def log_progress(current: int, total: int, operation: str) -> None:
         operation: Operation description
     """
     logger = get_logger("metaclaude.progress")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     percentage = (current / total) * 100 if total > 0 else 0
     logger.info(f"⏳ {operation}: {current}/{total} ({percentage:.1f}%)")
 
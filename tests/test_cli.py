@@ -6,4 +6,46 @@ runner = CliRunner()
 def test_app():
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
-    assert "Usage: metaclaude [OPTIONS] COMMAND [ARGS]" in result.stdout
\ No newline at end of file
+    assert "Usage: metaclaude [OPTIONS] COMMAND [ARGS]" in result.stdout
+
+def test_doctor_reports_unresponsive_daemon(monkeypatch, tmp_path):
+    import docker
+    from docker.errors import DockerException
+    from requests.exceptions import ReadTimeout
+
+    def from_env(**kwargs):
+        try:
+            raise ReadTimeout("read timed out")
+        except ReadTimeout as e:
+            raise DockerException("Error while fetching server API version") from e
+
+    monkeypatch.setattr(docker, "from_env", from_env)
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["doctor"])
+    assert "Daemon unresponsive" in result.output
+
+
+def test_quiet_prints_only_json_on_stdout(monkeypatch, tmp_path):
+    import json
+    from metaclaude.core import orchestrator
+    from metaclaude.utils.logging import get_logger, setup_logging
+
+    class FakeOrchestrator:
+        def __init__(self, **kwargs):
+            pass
+
+        def execute(self, **kwargs):
+            get_logger("metaclaude.core.orchestrator").info("Executing workflow")
+            return {"output_path": tmp_path / "out", "execution_time": 1.5}
+
+    monkeypatch.setattr(orchestrator, "MetaClaudeOrchestrator", FakeOrchestrator)
+    monkeypatch.chdir(tmp_path)
+    try:
+        result = runner.invoke(app, ["main", "Create a React todo app", "--quiet"])
+    finally:
+        setup_logging()
+
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0]) == {"output_path": str(tmp_path / "out"), "duration": 1.5}
@@ -0,0 +1,44 @@
+import copy
+
+import pytest
+
+from metaclaude.config.manager import ConfigManager
+from metaclaude.config.models import ConfigDefaults
+from metaclaude.utils.errors import MetaClaudeConfigError
+
+
+def test_development_config_keeps_defaults():
+    config = ConfigDefaults.get_development_config()
+    assert config["logging"]["level"] == "DEBUG"
+    assert config["debug"] is True
+    assert config["execution"]["timeout"] == 1800
+    assert config["docker"]["image_name"] == "metaclaude"
+    assert config["execution"]["max_retries"] == 3
+    assert ConfigDefaults.get_default_config()["logging"]["level"] == "INFO"
+
+
+def test_load_config_checks_build_context(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    manager = ConfigManager()
+
+    manager.load_config(cli_overrides={"docker": {"build_context": str(tmp_path)}})
+    manager.validate_runtime_preconditions()
+
+    missing = {"docker": {"build_context": str(tmp_path / "missing")}}
+    with pytest.raises(MetaClaudeConfigError, match="build context does not exist"):
+        ConfigManager().load_config(cli_overrides=missing)
+
+    manager.load_config(cli_overrides=missing, validate=False)
+    with pytest.raises(MetaClaudeConfigError, match="build context does not exist"):
+        manager.validate_runtime_preconditions()
+    assert not (tmp_path / "missing").exists()
+
+
+def test_load_config_leaves_cli_overrides_untouched(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    overrides = {"docker": {"image_tag": "dev"}, "mcp": {"servers": {"demo": {"command": "demo"}}}}
+    expected = copy.deepcopy(overrides)
+
+    config = ConfigManager().load_config(cli_overrides=overrides)
+    assert config.docker.image_tag == "dev"
+    assert overrides == expected
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+
+import pytest
+import yaml
+
+from metaclaude.agents.natural_claude_creator import (
+    NaturalClaudeAgentCreator,
+    _parse_simple_front_matter,
+)
+
+
+def _convert(front_matter):
+    creator = NaturalClaudeAgentCreator()
+    content = f"---\n{front_matter}\n---\n\n# Agent\n\nDo the work.\n"
+    agent = creator._parse_agent_file_content(content, "/workspace/.claude/agents/demo-agent.md")
+    return creator.convert_to_agent_configs([agent])[0]
+
+
+def test_convert_splits_comma_separated_tools():
+    config = _convert("name: Demo\ndescription: Builds things\ntools: Read, Write, Bash")
+    assert config.tools == ["Read", "Write", "Bash"]
+    assert config.description == "Builds things (Claude-created)"
+
+
+def test_convert_normalizes_invalid_front_matter_types():
+    config = _convert("name: 42\ndescription:\ntools:\n  - Read\n  - {Write: true}")
+    assert config.name == "42"
+    assert config.description == "Claude-created agent (Claude-created)"
+    assert config.tools == ["Read", "Write", "Edit", "TodoWrite"]
+
+    config = _convert("description: Builds things\ntools: []")
+    assert config.name == "demo-agent"
+    assert config.tools == ["Read", "Write", "Edit", "TodoWrite"]
+
+
+@pytest.mark.parametrize(
+    "front_matter",
+    [
+        "name: Demo\ndescription: Builds things\ntools: [Read, Write]\nparallelism: 2",
+        "name: 'Demo'\ndescription: \"Builds: things\"\npatterns: ['coder', \"tester\"]",
+        "name: null\ndescription: Builds things",
+        "name: Demo\ndescription: yes",
+        "name: Demo\ntools: [Read, true, ~]",
+        "name: 42\nparallelism: 010",
+        "name: Demo\ndescription: Builds: things",
+        "name: Demo\ndescription: 2024-01-01",
+        "name: - Demo",
+    ],
+)
+def test_simple_front_matter_matches_yaml(front_matter):
+    metadata = _parse_simple_front_matter(front_matter)
+    if metadata is not None:
+        assert metadata == yaml.safe_load(front_matter)
+
+
+def test_simple_front_matter_defers_yaml_scalars():
+    assert _parse_simple_front_matter("name: Demo\ndescription: Builds things") is not None
+    for value in ("null", "~", "yes", "False", "42", "Builds: things", "- Demo"):
+        assert _parse_simple_front_matter(f"name: Demo\ndescription: {value}") is None
+
+
+def test_wait_for_agent_files_runs_exec_off_event_loop():
+    calls = []
+
+    class FakeDockerManager:
+        def execute_command(self, container, command, workdir=None):
+            calls.append(threading.current_thread() is threading.main_thread())
+            return (0, "" if len(calls) < 2 else "/workspace/.claude/agents/demo.md\n")
+
+    creator = NaturalClaudeAgentCreator(docker_manager=FakeDockerManager())
+    assert asyncio.run(creator._wait_for_agent_files(object(), timeout=0.1, interval=0.01))
+    assert calls == [False, False]
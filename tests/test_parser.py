@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from metaclaude.agents import parser as parser_module
+from metaclaude.agents.parser import AgentConfigFast, AgentParser, split_front_matter
+
+
+def test_split_front_matter():
+    content = "---\nname: demo\ntools: [Read]\n---\n\n# Demo\n\nBody --- text\n"
+    assert split_front_matter(content) == ("name: demo\ntools: [Read]", "# Demo\n\nBody --- text")
+
+
+def test_split_front_matter_unterminated():
+    assert split_front_matter("---\nname: demo\n# Demo\n") is None
+
+
+def test_get_agent_capabilities():
+    config = AgentConfigFast(
+        name="demo",
+        description="Demo agent",
+        tools=["Read", "Edit", "WebFetch"],
+        content="# Demo",
+        file_path="demo.md",
+        patterns=["coder"],
+    )
+    capabilities = AgentParser().get_agent_capabilities(config)
+    assert capabilities["can_read_files"] and capabilities["can_write_files"]
+    assert capabilities["can_search_web"] and capabilities["supports_coding"]
+    assert not capabilities["can_execute_bash"] and not capabilities["supports_testing"]
+
+    capabilities = AgentParser().get_agent_capabilities(
+        AgentConfigFast(name="bash", description="", tools=["Bash"], content="", file_path="")
+    )
+    assert capabilities["can_execute_bash"]
+    assert not capabilities["can_write_files"] and not capabilities["can_search_web"]
+
+
+def _write_agent(agents_dir, name):
+    (agents_dir / f"{name}.md").write_text(
+        f"---\nname: {name}\ndescription: Demo agent\ntools: [Read]\n---\n\n# {name}\n"
+    )
+
+
+def test_parse_agents_directory_skips_vanished_files(monkeypatch, tmp_path):
+    _write_agent(tmp_path, "kept")
+    _write_agent(tmp_path, "vanished")
+    real_stat = Path.stat
+
+    def stat(path, *args, **kwargs):
+        if path.name == "vanished.md":
+            raise FileNotFoundError(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", stat)
+    assert list(AgentParser().parse_agents_directory(tmp_path)) == ["kept"]
+
+
+def test_parse_agents_directory_skips_pool_when_cached(monkeypatch, tmp_path):
+    _write_agent(tmp_path, "demo")
+    agent_parser = AgentParser()
+    first = agent_parser.parse_agents_directory(tmp_path)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool should not be created")
+
+    monkeypatch.setattr(parser_module, "ThreadPoolExecutor", no_pool)
+    assert agent_parser.parse_agents_directory(tmp_path) == first
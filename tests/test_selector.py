@@ -0,0 +1,135 @@
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from metaclaude.agents.selector import AgentSelector, IdeaAnalysis
+
+AGENTS_DIR = Path(__file__).resolve().parent.parent / "templates" / ".claude" / "agents"
+
+
+@pytest.fixture
+def selector(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return AgentSelector(AGENTS_DIR)
+
+
+def test_keywords_do_not_match_inside_words(selector):
+    # Substring matching used to find "api" in "rapid" and "ai" in "email"
+    assert selector.analyze_idea("A rapid prototype tool").project_type == "general"
+    assert selector.analyze_idea("A rapid prototype tool").domains == ()
+    assert selector.analyze_idea("Send email reminders").domains == ()
+
+
+def test_keywords_no_longer_match_word_fragments(selector):
+    # "microservices" used to count as the "service" keyword
+    analysis = selector.analyze_idea("Split the monolith into microservices")
+    assert analysis.project_type == "general"
+    assert analysis.domains == ()
+
+
+def test_plural_and_compound_tokens_contribute_keywords(selector):
+    # Plural "models" matches "model"; "docker-compose" contributes "docker"
+    analysis = selector.analyze_idea("Deploy models with docker-compose")
+    assert analysis.domains == ("ml", "devops")
+    assert analysis.technologies == ("docker",)
+
+
+def test_keywords_match_plurals_and_compounds(selector):
+    analysis = selector.analyze_idea("Build REST apis for ML models")
+    assert analysis.domains == ("web", "ml")
+    assert analysis.project_type == "api"
+
+    analysis = selector.analyze_idea("Next.js site with ci/cd pipeline")
+    assert "web" in analysis.domains
+    assert "devops" in analysis.domains
+
+
+def test_earliest_project_type_wins(selector):
+    assert selector.analyze_idea("A web app with a backend").project_type == "webapp"
+    assert selector.analyze_idea("A backend for a web app").project_type == "api"
+
+
+def test_domains_follow_table_order(selector):
+    analysis = selector.analyze_idea("docker database mobile app, machine learning, web")
+    assert analysis.domains == ("web", "mobile", "ml", "data", "devops")
+
+
+def test_selection_truncates_in_priority_order(selector):
+    idea = "database machine learning web docker kubernetes security mobile"
+    names = [agent.name for agent in selector.select_agents(idea, max_agents=4)]
+    assert names == ["fullstack-engineer", "ml-dl-engineer", "devops-engineer", "qa-engineer"]
+    names = [agent.name for agent in selector.select_agents(idea, max_agents=2)]
+    assert names == ["fullstack-engineer", "ml-dl-engineer"]
+
+
+def test_forced_agents_filling_selection_skip_analysis(selector, monkeypatch):
+    def fail(idea):
+        raise AssertionError("analysis should not run")
+
+    monkeypatch.setattr(selector, "analyze_idea", fail)
+    selected = selector.select_agents(
+        "Build a machine learning API",
+        force_agents=["qa-engineer", "missing-agent", "devops-engineer", "qa-engineer"],
+        max_agents=2,
+    )
+    assert [agent.name for agent in selected] == ["qa-engineer", "devops-engineer"]
+
+
+def test_analyze_idea_returns_frozen_dataclass(selector):
+    analysis = selector.analyze_idea("Create a React todo app")
+    assert isinstance(analysis, IdeaAnalysis)
+    assert selector.analyze_idea("Create a React todo app") is analysis
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        analysis.complexity = "high"
+
+
+def _write_agent(agents_dir, name, description):
+    (agents_dir / f"{name}.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\ntools: [Read]\n---\n\n"
+        f"# {name}\n\nYou are a helpful agent that writes careful code.\n"
+    )
+
+
+def test_agents_cache_invalidated_when_agent_file_changes(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    agents_dir = tmp_path / "agents"
+    agents_dir.mkdir()
+    _write_agent(agents_dir, "demo-agent", "First description")
+
+    first = AgentSelector(agents_dir).available_agents
+    assert first["demo-agent"].description == "First description"
+    assert len(list((tmp_path / "cache").glob("metaclaude/agents-*.json"))) == 1
+
+    _write_agent(agents_dir, "demo-agent", "Second, longer description")
+    second = AgentSelector(agents_dir).available_agents
+    assert second["demo-agent"].description == "Second, longer description"
+
+
+def test_corrupt_agents_cache_falls_back_to_parsing(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    agents_dir = tmp_path / "agents"
+    agents_dir.mkdir()
+    _write_agent(agents_dir, "demo-agent", "Demo description")
+
+    cache_path = AgentSelector(agents_dir)._agents_cache_path()
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text('{"demo-agent": {"name": "demo-agent"}}')
+
+    agents = AgentSelector(agents_dir).available_agents
+    assert agents["demo-agent"].description == "Demo description"
+
+
+def test_agents_cache_disabled_without_home(monkeypatch, tmp_path):
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    agents_dir = tmp_path / "agents"
+    agents_dir.mkdir()
+    _write_agent(agents_dir, "demo-agent", "Demo description")
+
+    selector = AgentSelector(agents_dir)
+    assert selector._agents_cache_path() is None
+    assert selector.available_agents["demo-agent"].description == "Demo description"
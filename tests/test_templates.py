@@ -0,0 +1,19 @@
+from metaclaude.agents.templates import AgentPattern, AgentTemplateFactory
+
+
+def test_to_dict_returns_independent_lists():
+    template = AgentTemplateFactory.create_template(AgentPattern.CODER)
+    first = template.to_dict()
+    assert isinstance(first["tools"], list)
+    assert first["patterns"] == ["coder"]
+
+    first["tools"].append("Extra")
+    first["name"] = "changed"
+    second = AgentTemplateFactory.create_template(AgentPattern.CODER).to_dict()
+    assert "Extra" not in second["tools"]
+    assert second["name"] != "changed"
+
+    template = AgentTemplateFactory.create_template(AgentPattern.CODER, name="demo")
+    template.to_dict()
+    template.description = "Updated description"
+    assert template.to_dict()["description"] == "Updated description"